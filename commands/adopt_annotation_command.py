@@ -68,10 +68,6 @@ class AdoptAnnotationCommand(ICommand):
         for uuid in self._inserted_uuids:
             self._tag_manager.delete_tag(uuid, self._target_model)
 
-        for tag in self._tag_models:
-            tag_data = tag.to_dict()
-            tag.set_position(tag_data["position"] - self._sentence_offset)
-
         self._comparison_model.unmark_sentence_as_adopted(
             self._marked_sentence_index)
 
@@ -1556,13 +1556,13 @@ class Controller(IController):
             "start_data": start_data,
         }
 
-        self._comparison_model.set_comparison_data(comparison_data)
+        # Notify the observers once, after the internal flags and index are restored
+        with self._comparison_model.batched_notify():
+            self._comparison_model.set_comparison_data(comparison_data)
 
-        # Step 7: Restore internal flags and index
-        self._comparison_model._current_index = current_index
-        self._comparison_model._adopted_flags = document.get(
-            "adopted_flags", [False] * len(comparison_sentences)
-        )
+            # Step 7: Restore internal flags and index
+            self._comparison_model.restore_progress(
+                current_index, document.get("adopted_flags"))
 
     def extract_tags_from_document(self, documents) -> None:
         """
@@ -1596,8 +1596,9 @@ class Controller(IController):
             sentence_func (Callable[[], List[str]]): Function to retrieve the target sentence(s).
         """
         sentences = sentence_func()
-        tags = [[TagModel(tag_data) for tag_data in self._tag_processor._extract_tags_from_text(
-            sentence)] for sentence in sentences]
+        extract_tags = self._tag_processor._extract_tags_from_text
+        tags = [TagModel.from_tag_data_list(extract_tags(sentence))
+                for sentence in sentences]
         self._comparison_model.update_documents(sentences, tags)
 
     def perform_adopt_annotation(self, adoption_index: int) -> None:
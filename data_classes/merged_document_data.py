@@ -0,0 +1,43 @@
+from dataclasses import dataclass
+from typing import Dict, List
+
+
+@dataclass
+class MergedDocumentData:
+    """
+    Represents the serializable state of the merged document of a comparison.
+
+    The fields are fixed, so the instance is slot-backed instead of carrying a per-instance dict.
+    It is converted to a plain dictionary only when the comparison document is written.
+
+    Attributes:
+        file_name (str): The file name of the merged document.
+        file_path (str): The file path of the merged document.
+        meta_tags (Dict[str, List[str]]): The serialized meta tags, one joined tag string per tag type.
+        plain_text (str): The text of the merged document with all tags removed.
+        tags (List[Dict]): The tag dictionaries with their positions in the plain text.
+    """
+
+    __slots__ = ("file_name", "file_path", "meta_tags", "plain_text", "tags")
+
+    file_name: str
+    file_path: str
+    meta_tags: Dict[str, List[str]]
+    plain_text: str
+    tags: List[Dict]
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the merged document data as a dictionary in the saved file layout.
+
+        Returns:
+            Dict: The merged document data with the keys "file_name", "file_path", "meta_tags",
+                "plain_text" and "tags".
+        """
+        return {
+            "file_name": self.file_name,
+            "file_path": self.file_path,
+            "meta_tags": self.meta_tags,
+            "plain_text": self.plain_text,
+            "tags": self.tags,
+        }
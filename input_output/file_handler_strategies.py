@@ -20,9 +20,9 @@ class JsonReadWriteStrategy(IReadWriteStrategy):
         with open(file_path, 'r', encoding=self.encoding) as file:
             return json.load(file)
 
-    def write(self, file_path: str, data: Dict) -> bool:
+    def write(self, file_path: str, data: Dict, buffer_size: int = -1) -> bool:
         try:
-            with open(file_path, 'w', encoding=self.encoding) as file:
+            with open(file_path, 'w', encoding=self.encoding, buffering=buffer_size) as file:
                 json.dump(data, file, ensure_ascii=False, indent=4)
             return True
         except Exception:
@@ -49,12 +49,12 @@ class CsvReadWriteStrategy(IReadWriteStrategy):
                 data.append(row)
         return {"data": data}
 
-    def write(self, file_path: str, data: Dict) -> bool:
+    def write(self, file_path: str, data: Dict, buffer_size: int = -1) -> bool:
         try:
             if "data" not in data:
                 raise ValueError(
                     "Data dictionary must contain a 'data' key with a list of rows.")
-            with open(file_path, 'w', encoding=self.encoding, newline='') as file:
+            with open(file_path, 'w', encoding=self.encoding, newline='', buffering=buffer_size) as file:
                 writer = csv.DictWriter(
                     file, fieldnames=data["data"][0].keys())
                 writer.writeheader()
@@ -81,11 +81,11 @@ class TxtReadWriteStrategy(IReadWriteStrategy):
             text = file.read()
         return {"text": text}
 
-    def write(self, file_path: str, data: Dict) -> bool:
+    def write(self, file_path: str, data: Dict, buffer_size: int = -1) -> bool:
         try:
             if "text" not in data:
                 raise ValueError("Data dictionary must contain a 'text' key.")
-            with open(file_path, 'w', encoding=self.encoding) as file:
+            with open(file_path, 'w', encoding=self.encoding, buffering=buffer_size) as file:
                 file.write(data["text"])
             return True
         except Exception:
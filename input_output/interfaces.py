@@ -19,13 +19,15 @@ class IFileHandler(ABC):
         pass
 
     @abstractmethod
-    def write_file(self, file_path: str, data: Dict) -> None:
+    def write_file(self, file_path: str, data: Dict, *, buffer_size: int = -1) -> None:
         """
         Writes data to a file using the appropriate strategy based on file extension.
 
         Args:
             file_path (str): Path to the file to be written.
             data (Dict): Data to be written to the file.
+            buffer_size (int, optional): Size hint in bytes for the write buffer. Defaults to -1,
+                which uses the default buffering.
         """
         pass
 
@@ -82,13 +84,15 @@ class IReadWriteStrategy(ABC):
         pass
 
     @abstractmethod
-    def write(self, file_path: str, data: Dict) -> None:
+    def write(self, file_path: str, data: Dict, buffer_size: int = -1) -> None:
         """
         Writes data to the file.
 
         Args:
             file_path (str): Path to the file.
             data (Dict): Data to be written.
+            buffer_size (int, optional): Size of the write buffer in bytes. Defaults to -1,
+                which uses the default buffering.
         """
         pass
 
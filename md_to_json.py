@@ -3,9 +3,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict
 
+# All spellings of the markdown suffix, checked without allocating a lowercased copy
+_MD_SUFFIXES = (".md", ".MD", ".Md", ".mD")
+
 
 def _make_document(md_path: Path, schema_version: int = 2) -> Dict[str, Any]:
     """
@@ -41,17 +45,35 @@ def _make_document(md_path: Path, schema_version: int = 2) -> Dict[str, Any]:
 
 def _write_json(doc: Dict[str, Any], out_path: Path) -> None:
     """
-    Write JSON with correct escaping (including newlines) via json.dump.
+    Write JSON with correct escaping (including newlines) via json.dumps.
+
+    The data is written to a temporary file next to the target which then replaces
+    the target, so an interrupted run never leaves a truncated JSON file behind.
+    The parent directory of out_path must already exist.
 
     Args:
         doc: The document dict to serialize.
         out_path: Where to write the JSON.
     """
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
     # ensure_ascii=False keeps umlauts readable; json handles escaping of control chars/newlines.
-    with out_path.open("w", encoding="utf-8", newline="\n") as f:
-        json.dump(doc, f, ensure_ascii=False, indent=4)
+    # Serialize in one go and hand the bytes to a single write call instead of going
+    # through the buffered text I/O stack with many small writes.
+    data = json.dumps(doc, ensure_ascii=False, indent=4).encode("utf-8")
+    tmp_path = out_path.with_suffix(out_path.suffix + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        # do not leave a partial temporary file behind for the next run
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def convert_directory(directory: Path, schema_version: int = 2) -> int:
@@ -68,8 +90,15 @@ def convert_directory(directory: Path, schema_version: int = 2) -> int:
     if not directory.exists() or not directory.is_dir():
         raise FileNotFoundError(f"Not a directory: {directory}")
 
-    md_files = sorted(p for p in directory.iterdir() if p.is_file() and p.suffix.lower() == ".md")
+    with os.scandir(directory) as entries:
+        md_files = sorted(
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(_MD_SUFFIXES) and entry.is_file()
+        )
 
+    # All outputs are written next to their inputs, so the target directory
+    # already exists and _write_json does not need to create it per file.
     count = 0
     for md_path in md_files:
         out_path = md_path.with_suffix(".json")
@@ -1,5 +1,6 @@
-from typing import List, Optional, Tuple
-from typing import Dict, List, Tuple, Union
+from array import array
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from model.highlight_model import HighlightModel
 from model.interfaces import IComparisonModel, IDocumentModel, ITagModel
 from observer.interfaces import IObserver
@@ -10,8 +11,23 @@ class ComparisonModel(IComparisonModel):
     A specialized DocumentModel for managing comparison text.
     """
 
+    __slots__ = (
+        "_suppress_notify",
+        "_file_name",
+        "_document_models",
+        "_highlight_models",
+        "_file_names",
+        "_source_file_paths",
+        "_merged_document",
+        "_comparison_sentences",
+        "_adopted_flags",
+        "_differing_to_global",
+        "_current_index",
+    )
+
     def __init__(self):
         super().__init__()
+        self._suppress_notify: bool = False
         self._set_defaults()
 
     def _set_defaults(self) -> None:
@@ -22,12 +38,43 @@ class ComparisonModel(IComparisonModel):
         self._document_models: list[IDocumentModel] = []
         self._highlight_models: list[HighlightModel] = []
         self._file_names: list[str] = []
+        self._source_file_paths: list[str] = []
         self._merged_document: Optional[IDocumentModel] = None
         self._comparison_sentences: list[list[str]] = []
-        self._adopted_flags: list[int] = []
-        self._differing_to_global: list[int] = []
+        self._adopted_flags: bytearray = bytearray()
+        self._differing_to_global: array = array("i")
         self._current_index: int = 0
 
+    def notify_observers(self) -> None:
+        """
+        Notifies all registered observers of changes, unless notifications are
+        currently being coalesced by `batched_notify`.
+        """
+        if self._suppress_notify:
+            return
+        super().notify_observers()
+
+    @contextmanager
+    def batched_notify(self) -> Iterator[None]:
+        """
+        Coalesces all observer notifications raised inside the block into a single one.
+
+        Nested blocks are supported; only the outermost block notifies the observers
+        once it is left.
+
+        Yields:
+            None
+        """
+        is_outermost = not self._suppress_notify
+        self._suppress_notify = True
+        try:
+            yield
+        finally:
+            if is_outermost:
+                self._suppress_notify = False
+        if is_outermost:
+            self.notify_observers()
+
     def reset(self) -> None:
         """
         Resets the comparison model to an empty state.
@@ -50,6 +97,9 @@ class ComparisonModel(IComparisonModel):
         """
         self._document_models = documents
         self._file_names = [document.get_file_name() for document in documents]
+        # The source documents never change their paths during a comparison session
+        self._source_file_paths = [document.get_file_path()
+                                   for document in documents[1:]]
 
     def set_highlight_models(self, highlight_models: List[HighlightModel]) -> None:
         """
@@ -99,14 +149,42 @@ class ComparisonModel(IComparisonModel):
         """
         self._file_name = comparison_data["file_name"]
         self._merged_document = comparison_data["merged_document"]
-        self._comparison_sentences = comparison_data["comparison_sentences"]
-        self._adopted_flags: List[int] = [
-            False for _ in self._comparison_sentences]
-        self._differing_to_global = comparison_data["differing_to_global"]
+        # Identical sentences across the columns share a single string object
+        sentence_pool: Dict[str, str] = {}
+        self._comparison_sentences = [
+            [sentence_pool.setdefault(sentence, sentence) for sentence in sentences]
+            for sentences in comparison_data["comparison_sentences"]]
+        num_sentences = len(
+            self._comparison_sentences[0]) if self._comparison_sentences else 0
+        self._adopted_flags = bytearray(num_sentences)
+        self._differing_to_global = array(
+            "i", comparison_data["differing_to_global"])
         self._current_index = 0
         self.notify_observers()
         self.update_documents(*comparison_data["start_data"])
 
+    def restore_progress(self, current_index: int, adopted_flags: Optional[List[bool]] = None) -> None:
+        """
+        Restores the current sentence index and the adopted flags of a saved comparison.
+
+        The adopted flags are sized to the comparison sentences, missing flags count as not adopted
+        and surplus flags are dropped.
+
+        Args:
+            current_index (int): The index of the current sentence.
+            adopted_flags (Optional[List[bool]], optional): The saved adopted flag per sentence.
+                Defaults to None, which keeps all sentences unadopted.
+        """
+        num_sentences = len(
+            self._comparison_sentences[0]) if self._comparison_sentences else 0
+        restored_flags = bytearray(num_sentences)
+        if adopted_flags is not None:
+            saved_flags = bytearray(map(bool, adopted_flags[:num_sentences]))
+            restored_flags[:len(saved_flags)] = saved_flags
+        self._adopted_flags = restored_flags
+        self._current_index = current_index
+        self.notify_observers()
+
     def next_sentences(self) -> List[str]:
         """
         Advances to the next sentence index in the comparison sentences list,
@@ -241,16 +319,15 @@ class ComparisonModel(IComparisonModel):
             "current_sentence_index": self._current_index,
             "document_type": "comparison",
             "comparison_sentences": self._comparison_sentences,
-            "adopted_flags": self._adopted_flags,
-            "differing_to_global": self._differing_to_global,
+            "adopted_flags": [bool(flag) for flag in self._adopted_flags],
+            "differing_to_global": self._differing_to_global.tolist(),
         }
 
         if self._merged_document:
             state["merged_document"] = self._merged_document.get_state()
 
         if self._document_models:
-            state["source_file_paths"] = [doc.get_file_path()
-                                          for doc in self._document_models[1:]]
+            state["source_file_paths"] = list(self._source_file_paths)
 
         return state
 
@@ -271,7 +348,7 @@ class ComparisonModel(IComparisonModel):
         """
         sentence_tags = self._document_models[adoption_index].get_tags()
         sentence = self._comparison_sentences[adoption_index][self._current_index]
-        is_adopted = self._adopted_flags[self._current_index]
+        is_adopted = bool(self._adopted_flags[self._current_index])
 
         return {
             "sentence_tags": sentence_tags,
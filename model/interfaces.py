@@ -1,11 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List,  Union
+from typing import ContextManager, Dict, List, Optional, Union
 from data_classes.search_result import SearchResult
 from observer.interfaces import IObserver, IPublisher
 
 
 class ITagModel(ABC):
-    pass
+    __slots__ = ()
 
 
 class IDocumentModel(IPublisher):
@@ -136,6 +136,8 @@ class IComparisonModel(IPublisher):
     and provides mechanisms for annotation adoption and merged document construction.
     """
 
+    __slots__ = ()
+
     def set_document_models(self, documents: List[IDocumentModel]) -> None:
         """
         Sets the list of documents to be compared.
@@ -166,6 +168,23 @@ class IComparisonModel(IPublisher):
         """
         pass
 
+    def batched_notify(self) -> ContextManager[None]:
+        """
+        Returns a context manager that coalesces all observer notifications raised inside
+        its block into a single one.
+        """
+        pass
+
+    def restore_progress(self, current_index: int, adopted_flags: Optional[List[bool]] = None) -> None:
+        """
+        Restores the current sentence index and the adopted flags of a saved comparison.
+
+        Args:
+            current_index (int): The index of the current sentence.
+            adopted_flags (Optional[List[bool]], optional): The saved adopted flag per sentence.
+        """
+        pass
+
     def next_sentence(self) -> None:
         """
         Advances to the next differing sentence in the list, wrapping around if necessary.
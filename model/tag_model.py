@@ -1,19 +1,39 @@
-from hashlib import md5
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
 from model.interfaces import ITagModel
 
+# Keys of the tag data dictionary that are stored as dedicated attributes
+_TAG_FIELDS = frozenset({"uuid", "tag_type", "attributes", "plain_position",
+                         "position", "text", "id_name", "references"})
+
+# Marks absent attributes, since None is a valid attribute value
+_MISSING = object()
+
 
 class TagModel(ITagModel):
     """
-    Represents a tag model with attributes stored in a dictionary.
+    Represents a tag model built from a tag data dictionary.
 
     This class encapsulates a tag's details, including its unique identifier (UUID),
-    type, attributes, position, text, ID string, and referenced attributes.
+    type, attributes, position, text, ID string, and referenced attributes. The known
+    fields are unpacked into dedicated attributes once, so the getters do not need
+    to probe a dictionary.
 
     Attributes:
-        _tag_data (Dict[str, Any]): A dictionary containing all tag-related data.
+        _uuid (str): The unique identifier of the tag.
+        _tag_type (str): The type of the tag.
+        _attributes (Dict[str, str]): The attribute name-value pairs of the tag.
+        _plain_position (Optional[int]): The position of the tag in the plain text.
+        _position (int): The position of the tag in the text.
+        _text (str): The content enclosed within the tag.
+        _id_name (str): The name of the ID attribute of the tag.
+        _references (Dict[str, ITagModel]): The referenced tags by attribute name.
+        _extra (Dict[str, Any]): Any further entries of the tag data dictionary.
     """
 
+    __slots__ = ("_uuid", "_tag_type", "_attributes", "_plain_position", "_position",
+                 "_text", "_id_name", "_references", "_extra",
+                 "_incoming_references_count")
+
     def __init__(self, tag_data: Dict[str, Any]):
         """
         Initializes a TagModel instance using a dictionary containing all necessary data.
@@ -28,8 +48,53 @@ class TagModel(ITagModel):
                 - "id_name" (str): The name of the ID attribute of the tag.
                 - "references" (Dict[str, ITagModel]): A dictionary mapping attribute names to referenced tags.
         """
-        super().__init__()
-        self._tag_data = tag_data
+        # ITagModel defines no initializer, so the unpacking is all there is to do
+        self._load(tag_data)
+
+    @classmethod
+    def from_tag_data_list(cls, tag_data_list: Iterable[Dict[str, Any]]) -> List["TagModel"]:
+        """
+        Creates one TagModel per tag data dictionary.
+
+        This is meant for bulk creation, e.g. for all tags extracted from a sentence. The
+        instances are allocated directly and filled by `_load`, which skips the per-instance
+        constructor dispatch.
+
+        Args:
+            tag_data_list (Iterable[Dict[str, Any]]): The tag data dictionaries, in the format
+                expected by `__init__`.
+
+        Returns:
+            List[TagModel]: The created tag models, in the order of the input.
+        """
+        new = cls.__new__
+        tags = []
+        append = tags.append
+        for tag_data in tag_data_list:
+            tag = new(cls)
+            tag._load(tag_data)
+            append(tag)
+        return tags
+
+    def _load(self, tag_data: Dict[str, Any]) -> None:
+        """
+        Unpacks a tag data dictionary into the attributes of the tag and resets
+        its incoming reference count.
+
+        Args:
+            tag_data (Dict[str, Any]): The tag data dictionary, see `__init__`.
+        """
+        self._uuid = tag_data.get("uuid", "")
+        self._tag_type = tag_data.get("tag_type", "")
+        self._attributes = tag_data.get("attributes", {})
+        self._plain_position = tag_data.get("plain_position", 0)
+        self._position = tag_data.get("position", 0)
+        self._text = tag_data.get("text", "")
+        self._id_name = tag_data.get("id_name", "")
+        self._references = tag_data.get("references", {})
+        # kept in input order, so saved documents list the extra keys consistently
+        self._extra = {key: value for key, value in tag_data.items()
+                       if key not in _TAG_FIELDS}
         self._incoming_references_count = 0
 
     def increment_reference_count(self) -> None:
@@ -72,7 +137,7 @@ class TagModel(ITagModel):
         Returns:
             str: The unique identifier of the tag.
         """
-        return self._tag_data.get("uuid", "")
+        return self._uuid
 
     def set_uuid(self, uuid: str) -> None:
         """
@@ -81,7 +146,7 @@ class TagModel(ITagModel):
         Args:
             uuid (str): The new UUID to assign to the tag.
         """
-        self._tag_data["uuid"] = uuid
+        self._uuid = uuid
 
     def get_attributes(self, keys: List[str] = None) -> Dict[str, str]:
         """
@@ -94,8 +159,14 @@ class TagModel(ITagModel):
         Returns:
             Dict[str, str]: A dictionary containing the requested attributes or all attributes.
         """
-        attributes = self._tag_data.get("attributes", {})
-        return attributes if keys is None else {key: attributes[key] for key in keys if key in attributes}
+        attributes = self._attributes
+        if keys is None:
+            # a copy, so callers cannot change the tag's attributes behind its back
+            return dict(attributes)
+        # Look up each requested key once instead of a membership test plus an index
+        get = attributes.get
+        return {key: value for key in keys
+                if (value := get(key, _MISSING)) is not _MISSING}
 
     def set_attributes(self, new_attributes: List[Tuple[str, str]]) -> None:
         """
@@ -104,7 +175,7 @@ class TagModel(ITagModel):
         Args:
             new_attributes (List[Tuple[str, str]]): A list of key-value pairs to update in the attributes dictionary.
         """
-        self._tag_data["attributes"].update(
+        self._attributes.update(
             {key: value for key, value in new_attributes})
 
     def get_tag_type(self) -> str:
@@ -114,7 +185,7 @@ class TagModel(ITagModel):
         Returns:
             str: The type of the tag.
         """
-        return self._tag_data.get("tag_type", "")
+        return self._tag_type
 
     def set_tag_type(self, tag_type: str) -> None:
         """
@@ -123,7 +194,7 @@ class TagModel(ITagModel):
         Args:
             tag_type (str): The new tag type to set.
         """
-        self._tag_data["tag_type"] = tag_type
+        self._tag_type = tag_type
 
     def get_plain_position(self) -> int:
         """
@@ -132,7 +203,7 @@ class TagModel(ITagModel):
         Returns:
             int: The position of the tag in the plain text.
         """
-        return self._tag_data.get("plain_position", 0)
+        return self._plain_position
     
     def set_plain_position(self, position: int) -> None:
         """
@@ -141,7 +212,7 @@ class TagModel(ITagModel):
         Args:
             position (int): The new plain text position of the tag.
         """
-        self._tag_data["plain_position"] = position
+        self._plain_position = position
 
     def get_position(self) -> int:
         """
@@ -150,7 +221,7 @@ class TagModel(ITagModel):
         Returns:
             int: The position of the tag in the text.
         """
-        return self._tag_data.get("position", 0)
+        return self._position
 
     def set_position(self, position: int) -> None:
         """
@@ -159,7 +230,7 @@ class TagModel(ITagModel):
         Args:
             position (int): The new position of the tag in the text.
         """
-        self._tag_data["position"] = position
+        self._position = position
 
     def get_text(self) -> str:
         """
@@ -168,7 +239,7 @@ class TagModel(ITagModel):
         Returns:
             str: The text associated with the tag.
         """
-        return self._tag_data.get("text", "")
+        return self._text
 
     def set_text(self, text: str) -> None:
         """
@@ -177,7 +248,7 @@ class TagModel(ITagModel):
         Args:
             text (str): The new text to associate with the tag.
         """
-        self._tag_data["text"] = text
+        self._text = text
 
     def get_id(self) -> str:
         """
@@ -186,7 +257,7 @@ class TagModel(ITagModel):
         Returns:
             str: The ID of the tag, if present in the attributes. Otherwise, an empty string.
         """
-        return self._tag_data.get("attributes", {}).get("id", "")
+        return self._attributes.get("id", "")
 
     def set_id(self, new_id: str) -> None:
         """
@@ -195,7 +266,7 @@ class TagModel(ITagModel):
         Args:
             new_id (str): The new ID to set for the tag.
         """
-        self._tag_data["attributes"]["id"] = new_id
+        self._attributes["id"] = new_id
 
     def get_id_name(self) -> str:
         """
@@ -204,7 +275,7 @@ class TagModel(ITagModel):
         Returns:
             str: The name of the ID attribute.
         """
-        return self._tag_data.get("id_name", "")
+        return self._id_name
 
     def set_id_name(self, new_id_name: str) -> None:
         """
@@ -213,7 +284,7 @@ class TagModel(ITagModel):
         Args:
             new_id_name (str): The new ID attribute name.
         """
-        self._tag_data["id_name"] = new_id_name
+        self._id_name = new_id_name
 
     def get_references(self) -> Dict[str, ITagModel]:
         """
@@ -222,7 +293,7 @@ class TagModel(ITagModel):
         Returns:
             Dict[str, str]: A dictionary mapping attribute names to referenced tag UUIDs.
         """
-        return self._tag_data.get("references", {})
+        return self._references
 
     def set_references(self, references: Dict[str, str]) -> None:
         """
@@ -231,15 +302,17 @@ class TagModel(ITagModel):
         Args:
             references (Dict[str, str]): A dictionary mapping attribute names to referenced tag UUIDs.
         """
-        self._tag_data["references"] = references
+        self._references = references
 
     def to_dict(self) -> Dict[str, Any]:
         """
-        Returns the complete internal tag data as a dictionary.
+        Returns the complete tag data as a newly built dictionary.
 
         This includes all structural and semantic properties of the tag, such as 
         its type, attributes, position, textual content, ID metadata, UUID, reference
-        mapping, and equivalent UUIDs.
+        mapping, and equivalent UUIDs. The attribute and reference dictionaries are
+        copied, so modifying the result does not affect the tag itself. The UUID is
+        omitted if the tag has none yet.
 
         Returns:
             Dict[str, Any]: A dictionary containing:
@@ -250,8 +323,21 @@ class TagModel(ITagModel):
                 - "uuid" (str): The unique identifier for the tag.
                 - "id_name" (str): The name of the ID attribute.
                 - "references" (Dict[str, ITagModel]): Attribute-to-tag reference mapping.
-        """
-        return self._tag_data
+                - "plain_position" (int): Character offset of the tag in the plain text.
+        """
+        tag_data = {
+            **self._extra,
+            "tag_type": self._tag_type,
+            "attributes": dict(self._attributes),
+            "position": self._position,
+            "plain_position": self._plain_position,
+            "text": self._text,
+            "id_name": self._id_name,
+            "references": dict(self._references),
+        }
+        if self._uuid:
+            tag_data["uuid"] = self._uuid
+        return tag_data
 
     def __str__(self) -> str:
         """
@@ -263,18 +349,15 @@ class TagModel(ITagModel):
             str: A string representation of the tag in the format:
                 <tag_type attr1="value1" attr2="value2">text</tag_type>
         """
-        attributes = self._tag_data.get("attributes", {})
-        attributes_str = ""
+        attributes = self._attributes
         if "id" in attributes:
-            attributes_str = f'{self._tag_data["id_name"]}="{attributes["id"]}"'
-            other_attrs = " ".join(
-                f'{key}="{value}"' for key, value in attributes.items() if key != "id"
-            )
-            if other_attrs:
-                attributes_str += " " + other_attrs
+            # The ID is written first, under the tag type's ID attribute name
+            attribute_strs = [f'{self._id_name}="{attributes["id"]}"']
+            attribute_strs.extend(
+                f'{key}="{value}"' for key, value in attributes.items() if key != "id")
         else:
-            attributes_str = " ".join(
-                f'{key}="{value}"' for key, value in attributes.items()
-            )
+            attribute_strs = [f'{key}="{value}"' for key, value in attributes.items()]
 
-        return f'<{self._tag_data["tag_type"]} {attributes_str}>{self._tag_data["text"]}</{self._tag_data["tag_type"]}>'
+        tag_type = self._tag_type
+        return "".join(("<", tag_type, " ", " ".join(attribute_strs), ">",
+                        self._text, "</", tag_type, ">"))
@@ -19,6 +19,8 @@ class IPublisher(ABC):
     A base interface for all publishers, managing both data and layout observers.
     """
 
+    __slots__ = ("_observers",)
+
     def __init__(self) -> None:
         """Initializes the publisher with empty lists for both data and layout observers."""
         self._observers: List[IObserver] = []
@@ -0,0 +1,84 @@
+import unittest
+
+from model.tag_model import TagModel
+from utils.document_manager import DocumentManager
+from utils.tag_manager import TagManager
+from utils.tag_processor import TagProcessor
+
+MERGED_TEXT = 'The <Chemical chemId="c1">water</Chemical> boils at <Temperature tempId="t1" subject="c1">100</Temperature> degrees.'
+
+
+class _ConfigurationController:
+    """Answers the tag configuration queries of the tag processor."""
+
+    _ID_NAMES = {"Chemical": "chemId", "Temperature": "tempId"}
+    _ID_REFS = {"Temperature": ["subject"]}
+
+    def get_id_name(self, tag_type):
+        return self._ID_NAMES.get(tag_type, "")
+
+    def get_id_refs(self, tag_type):
+        return self._ID_REFS.get(tag_type, [])
+
+
+class _DictFileHandler:
+    """Returns the stored document data for every path."""
+
+    def __init__(self, document_data):
+        self._document_data = document_data
+
+    def read_file(self, file_path):
+        return dict(self._document_data)
+
+
+class TestLoadComparisonDocument(unittest.TestCase):
+
+    def setUp(self):
+        self.tag_processor = TagProcessor(_ConfigurationController())
+        self.tag_manager = TagManager(None, self.tag_processor)
+
+    def _load(self, document_data):
+        document_manager = DocumentManager(
+            _DictFileHandler(document_data), self.tag_processor, self.tag_manager)
+        return document_manager.load_document("comparison.json")
+
+    def _assert_resolved_merged_tags(self, loaded):
+        tags = loaded["document"]["merged_document_data"]["tags"]
+        self.assertEqual([tag.get_tag_type() for tag in tags], ["Chemical", "Temperature"])
+        self.assertTrue(all(isinstance(tag, TagModel) for tag in tags))
+        chemical, temperature = tags
+        self.assertIs(temperature.get_references()["subject"], chemical)
+        self.assertNotIn("comparison_tags", loaded)
+
+    def test_schema_2_attaches_resolved_merged_document_tags(self):
+        merged = self.tag_processor.get_plain_text_and_tags(MERGED_TEXT)
+        loaded = self._load({
+            "document_type": "comparison",
+            "schema_version": 2,
+            "comparison_sentences": [],
+            "merged_document_data": {
+                "file_name": "merged",
+                "file_path": "",
+                "meta_tags": {},
+                "plain_text": merged["plain_text"],
+                "tags": merged["tags"],
+            },
+        })
+        self._assert_resolved_merged_tags(loaded)
+
+    def test_schema_1_attaches_resolved_merged_document_tags(self):
+        loaded = self._load({
+            "document_type": "comparison",
+            "comparison_sentences": [],
+            "merged_document_data": {
+                "file_name": "merged",
+                "file_path": "",
+                "meta_tags": {},
+                "text": MERGED_TEXT,
+            },
+        })
+        self._assert_resolved_merged_tags(loaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,3 @@
-import hashlib
-import os
-from pathlib import Path
-from typing import List
 import re
 from typing import Dict, List, Tuple, Union
 from controller.interfaces import IController
@@ -10,6 +6,9 @@ from model.interfaces import IDocumentModel
 from model.tag_model import TagModel
 from utils.interfaces import ITagProcessor
 
+# Runs of whitespace that are collapsed into a single space before comparison
+_WS_RE = re.compile(r'\s+')
+
 
 class ComparisonManager:
     def __init__(self, controller: IController, tag_processor: ITagProcessor):
@@ -42,12 +41,14 @@ class ComparisonManager:
                 - "merged_document" (IDocumentModel): The document model representing the merged output text.
         """
 
-        tagged_texts = self._prepare_tagged_texts(documents)
-        raw_texts = self._extract_clean_texts(tagged_texts)
+        tagged_texts, raw_texts = self._prepare_tagged_and_clean_texts(
+            documents)
         aligned_tagged, aligned_clean = self._align_similar_texts(
             tagged_texts, raw_texts)
 
-        self._common_text = aligned_tagged[0]
+        # Own copy with one slot per aligned sentence; differing sentences are
+        # overwritten in place by their raw version
+        self._common_text = list(aligned_tagged[0])
         raw_text = aligned_clean[0]
 
         self._extract_differing_tagged_sentences(
@@ -83,8 +84,9 @@ class ComparisonManager:
             comparison_sentences = self._comparison_sentences
         start_sentences = [
             sentences[sentence_index] for sentences in comparison_sentences]
-        start_tags = [[TagModel(tag_data) for tag_data in self._tag_processor._extract_tags_from_text(
-            sentence)] for sentence in start_sentences]
+        extract_tags = self._tag_processor._extract_tags_from_text
+        start_tags = [TagModel.from_tag_data_list(extract_tags(sentence))
+                      for sentence in start_sentences]
         return start_sentences, start_tags
 
     def _align_similar_texts(self, texts: List[List[str]], clean_texts: List[List[str]]) -> Tuple[List[List[str]], List[List[str]]]:
@@ -119,13 +121,11 @@ class ComparisonManager:
         """
         # Define helpers
 
-        def get_current_elements():
-            """Retrieves a list of clean sentences corresponding to the current indices"""
-            return [clean_text[index] if index < len(clean_text) else "" for clean_text, index in zip(clean_texts, sentence_indices)]
-
-        def are_clean_sentences_similar(sentences: List[str]) -> bool:
-            """Checks if all sentences in a list are similar"""
-            return all(sentence == sentences[0] for sentence in sentences[1:])
+        def advance(text_index: int) -> None:
+            """Moves the index of a text forward and refreshes its current clean sentence"""
+            index = sentence_indices[text_index] + 1
+            sentence_indices[text_index] = index
+            current_elements[text_index] = clean_texts[text_index][index] if index < text_lengths[text_index] else ""
 
         def append_elements(indices_to_append) -> None:
             """Appends the elements corresponding to the indices to texts and clean texts"""
@@ -134,9 +134,13 @@ class ComparisonManager:
                 aligned_clean_text.append(
                     clean_texts[text_index][sentence_index])
 
+        # Identical texts need no alignment, which is the common case when re-comparing
+        first_clean_text = clean_texts[0]
+        if all(clean_text == first_clean_text for clean_text in clean_texts[1:]):
+            return texts, clean_texts
+
         # Convert clean_texts to sets for comparison
-        clean_text_sets = [set(map(tuple, clean_text))
-                           for clean_text in clean_texts]
+        clean_text_sets = [set(clean_text) for clean_text in clean_texts]
 
         # Find the intersection across all clean_texts
         common_sentences = set.intersection(*clean_text_sets)
@@ -158,19 +162,31 @@ class ComparisonManager:
                 f"Similarity threshold not met. A text has only {min_ratio:.2%} overlap with the others, but at least {self._similarity_threshold:.2%} is required. The texts are likely not the same."
             )
 
+        # Let equal sentences share one object, so that the comparisons in the
+        # alignment loop are resolved by the identity check instead of by content
+        sentence_pool: Dict[str, str] = {}
+        clean_texts = [[sentence_pool.setdefault(sentence, sentence) for sentence in clean_text]
+                       for clean_text in clean_texts]
+
         aligned_texts = [[] for _ in texts]
         aligned_clean_texts = [[] for _ in clean_texts]
-        align_option = self._controller.get_align_option()
-
-        sentence_indices = [0]*len(clean_texts)
-        while any(index < len(clean_text) for clean_text, index in zip(clean_texts, sentence_indices)):
-            current_elements = get_current_elements()
-            if are_clean_sentences_similar(current_elements):
-                indices_to_append = [(text_index, sentence_index)
-                                     for text_index, sentence_index in enumerate(sentence_indices)]
+        # Normalize the align option once instead of comparing strings in the loop
+        align_option = self._controller.get_align_option().lower()
+        is_intersection = align_option == "intersection"
+        is_union = align_option == "union"
+
+        num_texts = len(clean_texts)
+        text_lengths = [len(clean_text) for clean_text in clean_texts]
+        sentence_indices = [0]*num_texts
+        # Clean sentences at the current indices, kept up to date by advance()
+        current_elements = [clean_text[0] if clean_text else ""
+                            for clean_text in clean_texts]
+        while any(index < length for length, index in zip(text_lengths, sentence_indices)):
+            if current_elements.count(current_elements[0]) == num_texts:
+                indices_to_append = list(enumerate(sentence_indices))
                 append_elements(indices_to_append)
-                for i in range(len(sentence_indices)):
-                    sentence_indices[i] += 1
+                for text_index in range(num_texts):
+                    advance(text_index)
                 continue
 
             # Handle non aligning sentences
@@ -188,23 +204,31 @@ class ComparisonManager:
             # all current sentences exist somewhere in the upcoming buffers, which likely
             # indicates a reordering or duplicate sentences with mismatched references.
             if not next_candidates:
-                if align_option == "intersection":
+                if is_intersection:
                     raise ValueError(
                         "Ambiguous sentence alignment detected: Possible reordering or duplicate sentences with mismatched references."
                     )
-                if align_option == "union":
-                    # just pick the sentence from the first text
-                    next_candidates = [current_elements[0]]
-                raise ValueError("No align option selected")
+                if not is_union:
+                    raise ValueError("No align option selected")
 
             # drop the sentences, which are not in all texts, if alignoption is intersection
-            if align_option.lower() == "intersection":
+            if is_intersection:
                 for _, text_index in next_candidates:
-                    sentence_indices[text_index] += 1
+                    advance(text_index)
                 continue
 
+            # Exhausted texts have no sentence left to add to the union
+            next_candidates = [(sentence, text_index) for sentence, text_index in next_candidates
+                               if sentence_indices[text_index] < text_lengths[text_index]]
+            if not next_candidates:
+                # just pick the sentence from the first text that is not exhausted
+                text_index = next(index for index, (sentence_index, length) in enumerate(
+                    zip(sentence_indices, text_lengths)) if sentence_index < length)
+                next_candidates = [(current_elements[text_index], text_index)]
+
                 # Check if potential next sentence is unique
-            if not are_clean_sentences_similar([sentence for sentence, _ in next_candidates]):
+            first_candidate = next_candidates[0][0]
+            if not all(sentence == first_candidate for sentence, _ in next_candidates):
                 # Count occurrences of sentences
                 count = {}
                 for sentence, _ in next_candidates:
@@ -220,13 +244,13 @@ class ComparisonManager:
             # Extract first selected index and apply to all texts
             _, text_index = next_candidates[0]
             indices_to_append = [
-                (text_index, sentence_indices[text_index])]*len(clean_texts)
+                (text_index, sentence_indices[text_index])]*num_texts
 
             append_elements(indices_to_append)
 
             # Increment indices for the selected sentences
             for _, text_index in next_candidates:
-                sentence_indices[text_index] += 1
+                advance(text_index)
 
         return aligned_texts, aligned_clean_texts
 
@@ -260,40 +284,37 @@ class ComparisonManager:
         Returns:
             List[str]: A list of cleaned sentences.
         """
-        return [re.sub(r'\s+', ' ', sentence.strip()) for sentence in text.split("\n\n")]
+        sub = _WS_RE.sub
+        return [sub(' ', sentence.strip()) for sentence in text.split("\n\n")]
 
-    def _prepare_tagged_texts(self, documents: List[IDocumentModel]) -> List[List[str]]:
+    def _prepare_tagged_and_clean_texts(self, documents: List[IDocumentModel]) -> Tuple[List[List[str]], List[List[str]]]:
         """
-        Extracts and splits the raw tagged text from each document into cleaned sentence lists.
+        Splits the tagged text of each document into cleaned sentence lists and derives
+        the corresponding tag-free sentence lists in the same pass.
 
         This method accesses the 'text' field from each document, splits it into sentences,
-        and normalizes whitespace and invisible characters for consistent comparison.
+        and normalizes whitespace and invisible characters for consistent comparison. Each
+        sentence is then converted into plain text by stripping all markup, which is used
+        for alignment and comparison purposes.
 
         Args:
             documents (List[IDocumentModel]): The documents to be processed.
 
         Returns:
-            List[List[str]]: A list of sentence lists, one per document.
-        """
-        tagged_texts = [self._prepare_text_for_comparison(
-            document.get_text()) for document in documents]
-        return tagged_texts
-
-    def _extract_clean_texts(self, tagged_texts: List[List[str]]) -> List[List[str]]:
-        """
-        Removes all tags from the tagged sentence lists to produce raw textual content.
-
-        This method converts each tagged sentence into plain text by stripping all markup,
-        which is used for alignment and comparison purposes.
-
-        Args:
-            tagged_texts (List[List[str]]): A list of sentence lists containing tagged content.
-
-        Returns:
-            List[List[str]]: A list of sentence lists with all tags removed.
+            Tuple[List[List[str]], List[List[str]]]: A tuple containing:
+                - A list of tagged sentence lists, one per document.
+                - A list of sentence lists with all tags removed, one per document.
         """
-        return [[self._tag_processor.delete_all_tags_from_text(sentence) for sentence in text]
-                for text in tagged_texts]
+        delete_all_tags = self._tag_processor.delete_all_tags_from_text
+        tagged_texts = []
+        clean_texts = []
+        for document in documents:
+            tagged_sentences = self._prepare_text_for_comparison(
+                document.get_text())
+            tagged_texts.append(tagged_sentences)
+            clean_texts.append([delete_all_tags(sentence)
+                               for sentence in tagged_sentences])
+        return tagged_texts, clean_texts
 
     def _extract_differing_tagged_sentences(self, raw_text: List[str], tagged_texts: List[List[str]]) -> None:
         """
@@ -309,30 +330,36 @@ class ComparisonManager:
             - Updates `self._comparison_sentences`: A list of lists where the first
             list contains the untagged raw sentences and the remaining lists contain
             differing tagged sentences per annotator.
-            - Updates `self._common_text`: A dictionary mapping sentence indices to
-            the corresponding raw sentence, used as shared reference text.
+            - Updates `self._common_text`: A list with one entry per aligned sentence, in
+            which each differing sentence is replaced by its raw version, used as shared
+            reference text.
             - Updates `self._differing_to_global`: A list mapping local differing sentence index
             to global sentence index in the merged document.
         """
         self._comparison_sentences = [[] for _ in range(len(tagged_texts) + 1)]
         self._differing_to_global = []
 
+        # Bind the callables and lists used in the loop to locals
+        remove_ids = self._tag_processor.remove_ids_from_tags
+        raw_sentences_append = self._comparison_sentences[0].append
+        differing_to_global_append = self._differing_to_global.append
+        annotator_appends = tuple(
+            sentence_list.append for sentence_list in self._comparison_sentences[1:])
+        common_text = self._common_text
+
         # Iterate over the sentences from all tagged texts simultaneously
         for global_index, sentences in enumerate(zip(*tagged_texts)):
             # Remove ID and IDREF attributes from all sentences
-            cleaned_sentences = [
-                self._tag_processor.remove_ids_from_tags(sentence)
-                for sentence in sentences
-            ]
+            cleaned_sentences = [remove_ids(sentence) for sentence in sentences]
 
             # Check if all cleaned sentences are identical
-            if any(sentence != cleaned_sentences[0] for sentence in cleaned_sentences[1:]):
+            if cleaned_sentences.count(cleaned_sentences[0]) != len(cleaned_sentences):
                 raw_sentence = raw_text[global_index]
 
                 # Add the differing sentence and its variants
-                self._comparison_sentences[0].append(raw_sentence)
-                for sentence_list, sentence in zip(self._comparison_sentences[1:], sentences):
-                    sentence_list.append(sentence)
+                raw_sentences_append(raw_sentence)
+                for annotator_append, sentence in zip(annotator_appends, sentences):
+                    annotator_append(sentence)
 
-                self._common_text[global_index] = raw_sentence
-                self._differing_to_global.append(global_index)
+                common_text[global_index] = raw_sentence
+                differing_to_global_append(global_index)
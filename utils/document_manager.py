@@ -1,9 +1,23 @@
+import re
+from itertools import chain, islice
+from typing import List
+from data_classes.merged_document_data import MergedDocumentData
 from input_output.interfaces import IFileHandler
 from model.tag_model import TagModel
 from utils.interfaces import ITagProcessor, ITagManager
 
+# Separator of serialized meta tags, absorbing the whitespace around each comma
+_META_SPLIT = re.compile(r"\s*,\s*")
+
+# Upper bound for the write buffer hint, since the whole buffer is allocated up front
+_MAX_WRITE_BUFFER = 1 << 20
+
 
 class DocumentManager():
+    __slots__ = ("_file_handler", "_tag_processor", "_tag_manager", "_get_plain_text_and_tags",
+                 "_merge_plain_text_and_tags", "_extract_tags_from_text", "_tag_object_adders",
+                 "_schema_2_transformers")
+
     def __init__(self, file_handler: IFileHandler, tag_processor: ITagProcessor, tag_manager: ITagManager) -> None:
         """
         Initializes the DocumentManager with a FileHandler, TagProcessor, and TagManager instance.
@@ -15,6 +29,20 @@ class DocumentManager():
         self._file_handler = file_handler
         self._tag_processor = tag_processor
         self._tag_manager = tag_manager
+        # Bound tag processor methods, resolved once since they are called per sentence
+        self._get_plain_text_and_tags = tag_processor.get_plain_text_and_tags
+        self._merge_plain_text_and_tags = tag_processor.merge_plain_text_and_tags
+        self._extract_tags_from_text = tag_processor._extract_tags_from_text
+        # Tag object creation for loaded documents, keyed by schema version
+        self._tag_object_adders = {
+            1: self._add_schema_1_tag_objects,
+            2: self._add_schema_2_tag_objects,
+        }
+        # Transformers for loaded documents of schema version 2, keyed by document type
+        self._schema_2_transformers = {
+            "comparison": self._transform_comparison_document,
+            "annotation": self._transform_annotation_document,
+        }
 
     def save_document(self,file_path:str, document:dict, view_id:str)-> bool:
         """
@@ -28,58 +56,58 @@ class DocumentManager():
         """
         # Prepare document data based on view type
         if not view_id == "comparison":
+            # read the content without mutating the caller's document
             if "text" in document:
-                inline_text=document.pop("text")
-                tags=[tag.to_dict() for tag in document.pop("tags",[])]
-                plain_text_and_tags=self._tag_processor.get_plain_text_and_tags(inline_text,tags)
+                tags=[tag.to_dict() for tag in document.get("tags",[])]
+                plain_text_and_tags=self._get_plain_text_and_tags(document["text"],tags)
                 plain_text=plain_text_and_tags["plain_text"]
                 tags=plain_text_and_tags["tags"]
                 for tag in tags:
                     tag["references"]={key:tag.get_uuid() for key,tag in tag.get("references", {}).items()}
-                document["plain_text"]=plain_text
-                document["tags"]=tags 
             elif "plain_text" not in document or "tags" not in document:
                 raise ValueError(
                     "Document must contain either 'text' or both 'plain_text' and 'tags' for saving.")
+            else:
+                plain_text=document["plain_text"]
+                tags=document["tags"]
             document_data = {"document_type": view_id,
                              "file_path": file_path,
                              "file_name": document["file_name"],
-                             "meta_tags": {
-                                 tag_type: [
-                                     ", ".join(str(tag) for tag in tags)]
-                                 for tag_type, tags in document.get("meta_tags", {}).items()
-                             },
-                             "plain_text": document["plain_text"],
-                             "tags": document["tags"],
+                             "meta_tags": self._stringify_meta_tags(document.get("meta_tags", {})),
+                             "plain_text": plain_text,
+                             "tags": tags,
                              "schema_version": 2
                              }
+            # serialized JSON grows with the text, mostly through the tag data
+            buffer_size = min(4096 + 4 * len(plain_text), _MAX_WRITE_BUFFER)
         else:
             # prepare data for comparison view
             old_comparison_sentences=document.get("comparison_sentences",[])
-            new_comparison_sentences=[]
-            for old_version in old_comparison_sentences:
-                new_version=[]
-                for inline_text in old_version:
-                    sentence_data={}
-                    plain_tags_and_tags=self._tag_processor.get_plain_text_and_tags(inline_text)
-                    sentence_data["plain_text"]=plain_tags_and_tags["plain_text"]
-                    sentence_data["tags"]=plain_tags_and_tags["tags"]
-                    new_version.append(sentence_data)
-                new_comparison_sentences.append(new_version)
+            # process all sentences of all versions in one flat pass and regroup afterwards;
+            # get_plain_text_and_tags already returns exactly the "plain_text" and "tags" keys.
+            # Versions often share identical sentences, so each distinct text is processed once.
+            get_plain_text_and_tags=self._get_plain_text_and_tags
+            processed_by_text={}
+            processed_sentences=[]
+            append_processed=processed_sentences.append
+            for inline_text in chain.from_iterable(old_comparison_sentences):
+                plain_text_and_tags=processed_by_text.get(inline_text)
+                if plain_text_and_tags is None:
+                    plain_text_and_tags=processed_by_text[inline_text]=get_plain_text_and_tags(inline_text)
+                append_processed(plain_text_and_tags)
+            new_comparison_sentences=self._regroup(
+                processed_sentences, [len(old_version) for old_version in old_comparison_sentences])
 
 
-            merged_document_data = {}
             merged_document = document.get("merged_document", {})
-            merged_document_data["file_name"]=merged_document.get_file_name()
-            merged_document_data["file_path"]=merged_document.get_file_path()
-            merged_document_data["meta_tags"]={
-                tag_type: [", ".join(str(tag) for tag in tags)]
-                for tag_type, tags in merged_document.get_meta_tags().items()
-            }
-            inline_text=merged_document.get_text()
-            plain_tags_and_tags=self._tag_processor.get_plain_text_and_tags(inline_text)
-            merged_document_data["plain_text"]=plain_tags_and_tags["plain_text"]
-            merged_document_data["tags"]=plain_tags_and_tags["tags"]
+            plain_tags_and_tags=get_plain_text_and_tags(merged_document.get_text())
+            merged_document_data = MergedDocumentData(
+                file_name=merged_document.get_file_name(),
+                file_path=merged_document.get_file_path(),
+                meta_tags=self._stringify_meta_tags(merged_document.get_meta_tags()),
+                plain_text=plain_tags_and_tags["plain_text"],
+                tags=plain_tags_and_tags["tags"],
+            )
 
             document_data = {
                 "document_type": "comparison",
@@ -91,19 +119,59 @@ class DocumentManager():
                 "comparison_sentences": new_comparison_sentences,
                 "adopted_flags": document.get("adopted_flags", []),
                 "differing_to_global": document.get("differing_to_global", []),
-                "merged_document_data": merged_document_data,
+                "merged_document_data": merged_document_data.to_dict(),
                 "schema_version": 2
                 }
+            buffer_size = min(4096 + len(processed_sentences) * 512, _MAX_WRITE_BUFFER)
             
 
         if document_data:
-            success = self._file_handler.write_file(file_path, document_data)
+            success = self._file_handler.write_file(file_path, document_data, buffer_size=buffer_size)
             return success
         else:
             raise ValueError(
                 "No valid document data found for saving. Ensure the active view is set correctly.")
 
 
+    def _stringify_meta_tags(self, meta_tags: dict) -> dict:
+        """
+        Serializes meta tags by joining the tags of each type into a single comma-separated string.
+        Args:
+            meta_tags (dict): Maps each meta tag type to its list of tags.
+        Returns:
+            dict: Maps each meta tag type to a one-element list holding the joined tag string.
+        """
+        if not meta_tags:
+            return {}
+        return {
+            tag_type: [", ".join(map(str, tags))]
+            for tag_type, tags in meta_tags.items()
+        }
+
+    def _parse_meta_tags(self, meta_tags: dict) -> dict:
+        """
+        Splits serialized meta tags back into a list of stripped tag strings per type.
+        Args:
+            meta_tags (dict): Maps each meta tag type to its comma-separated tag string.
+        Returns:
+            dict: Maps each meta tag type to the list of its tag strings.
+        """
+        if not meta_tags:
+            return {}
+        return {tag_type: _META_SPLIT.split(tags_str.strip()) for tag_type, tags_str in meta_tags.items()}
+
+    def _regroup(self, items: list, group_sizes: List[int]) -> List[list]:
+        """
+        Splits a flat list back into consecutive groups of the given sizes.
+        Args:
+            items (list): The flat list of items, ordered group by group.
+            group_sizes (List[int]): The number of items in each group.
+        Returns:
+            List[list]: One list per group size, holding the corresponding items.
+        """
+        items_iterator = iter(items)
+        return [list(islice(items_iterator, group_size)) for group_size in group_sizes]
+
     def load_document(self, file_path)->dict:
         """
         Loads a document from the given file path and transforms it to the internal schema if needed.
@@ -132,29 +200,69 @@ class DocumentManager():
         Raises:
             ValueError: If the document type is unknown.
         """
+        # schema versions above the newest known one are read like the newest one
+        add_tag_objects = self._tag_object_adders.get(
+            old_document_data.get("schema_version", 1), self._add_schema_2_tag_objects)
+        return add_tag_objects(new_document_data, old_document_data)
 
-        if new_document_data["document"].get("document_type") == "annotation":
-            return self._add_annotation_tags_to_document(new_document_data, old_document_data)
-        elif new_document_data["document"].get("document_type") == "comparison":
-            return self._add_comparison_tags_to_document(new_document_data, old_document_data)
-        raise ValueError(f"Unknown document type: {new_document_data['document'].get('document_type')}")
+    def _add_schema_2_tag_objects(self, new_document_data: dict, old_document_data: dict) -> dict:
+        """
+        Adds TagModel objects to a document of schema version 2, whose tags are stored alongside the plain texts.
+        Args:
+            new_document_data (dict): The document data that has been transformed to the internal schema.
+            old_document_data (dict): The original document data loaded from the file.
+        Returns:
+            dict: The document data with TagModel objects added.
+        Raises:
+            ValueError: If the document type is unknown.
+        """
+        document_type = new_document_data["document"].get("document_type")
+        if document_type == "annotation":
+            new_document_data["tags"] = self._create_resolved_tag_models(old_document_data.get("tags", []))
+        elif document_type == "comparison":
+            # only the merged document tags are read when a comparison is loaded
+            new_document_data["document"]["merged_document_data"]["tags"] = self._create_resolved_tag_models(
+                old_document_data.get("merged_document_data", {}).get("tags", []))
+        else:
+            raise ValueError(f"Unknown document type: {document_type}")
+        return new_document_data
 
-    
-    def _add_annotation_tags_to_document(self, new_document_data: dict, old_document_data: dict) -> dict:
-        schema_version = old_document_data.get("schema_version", 1)
-        if schema_version >= 2:
-            tags=old_document_data.get("tags", [])
+    def _add_schema_1_tag_objects(self, new_document_data: dict, old_document_data: dict) -> dict:
+        """
+        Adds TagModel objects to a document of schema version 1, whose tags are extracted from the inline texts.
+        Args:
+            new_document_data (dict): The document data that has been transformed to the internal schema.
+            old_document_data (dict): The original document data loaded from the file.
+        Returns:
+            dict: The document data with TagModel objects added.
+        Raises:
+            ValueError: If the document type is unknown.
+        """
+        document = new_document_data["document"]
+        document_type = document.get("document_type")
+        if document_type == "annotation":
+            new_document_data["tags"] = self._create_resolved_tag_models(
+                self._extract_tags_from_text(document["text"]))
+        elif document_type == "comparison":
+            # only the merged document tags are read when a comparison is loaded
+            merged_document_data = document["merged_document_data"]
+            merged_document_data["tags"] = self._create_resolved_tag_models(
+                self._extract_tags_from_text(merged_document_data["document"].get("text", "")))
         else:
-            document_text = new_document_data["document"]["text"]
-            tags = self._tag_processor._extract_tags_from_text(document_text)
-        tag_models=[TagModel(tag) for tag in tags]
-        tag_models=self._tag_manager.normalize_references(tag_models)
-        tag_models=self._tag_manager.resolve_all_references(tag_models)
-        new_document_data["tags"] = tag_models
+            raise ValueError(f"Unknown document type: {document_type}")
         return new_document_data
 
-    def _add_comparison_tags_to_document(self, new_document_data: dict, old_document_data: dict) -> dict:
-        pass
+    def _create_resolved_tag_models(self, tags: List[dict]) -> List[TagModel]:
+        """
+        Creates TagModel objects for the tags of one document and resolves their references.
+        Args:
+            tags (List[dict]): The tag dictionaries of the document.
+        Returns:
+            List[TagModel]: The tag models with normalized and resolved references.
+        """
+        tag_models=TagModel.from_tag_data_list(tags)
+        tag_models=self._tag_manager.normalize_references(tag_models)
+        return self._tag_manager.resolve_all_references(tag_models)
 
     def import_plain_text_document(self, file_path)->dict:
         """
@@ -184,86 +292,113 @@ class DocumentManager():
             dict: The transformed document.
         """
         schema_version = document.get("schema_version", 1)
-        if schema_version >= 2:
-            if document.get("document_type") == "comparison":
-                # Transform comparison document structure
-                transformed_document = {
-                    "document_type": "comparison",
-                    "file_name": document.get("file_name", ""),
-                    "source_paths": document.get("source_paths", []),
-                    "source_file_names": document.get("source_file_names", []),
-                    "file_path": document.get("file_path", ""),
-                    "num_sentences": document.get("num_sentences", 0),
-                    "current_sentence_index": document.get("current_sentence_index", 0),
-                    "comparison_sentences": [],
-                    "adopted_flags": document.get("adopted_flags", []),
-                    "differing_to_global": document.get("differing_to_global", []),
-                    "merged_document_data": {}
-                }
-                for sentence_group in document.get("comparison_sentences", []):
-                    transformed_group = []
-                    for sentence in sentence_group:
-                        inline_text = self._tag_processor.merge_plain_text_and_tags(
-                            sentence.get("plain_text", ""),
-                            sentence.get("tags",[])
-                        )
-                        transformed_group.append(inline_text)
-                    transformed_document["comparison_sentences"].append(transformed_group)
+        if schema_version < 2:
+            return self._transform_schema_1_document(document)
+        document_type = document.get("document_type")
+        transform = self._schema_2_transformers.get(document_type)
+        if transform is None:
+            if document_type == "extraction":
+                raise ValueError(
+                    "Extraction document type is not needed to be transformed.")
+            raise ValueError(
+                f"Unknown document type: {document_type}")
+        return transform(document)
 
-                old_merged_document_data = document.get("merged_document_data", {})
-                merged_inline_text = self._tag_processor.merge_plain_text_and_tags(
-                    old_merged_document_data.get("plain_text", ""),
-                    old_merged_document_data.get("tags", [])
-                )
-                new_merged_document_data = {
-                    "document":{
-                        "file_name": old_merged_document_data.get("file_name", ""),
-                        "file_path": old_merged_document_data.get("file_path", ""),
-                        "meta_tags": {
-                            tag_type: [tag.strip() for tag in tags_str.split(",")]
-                            for tag_type, tags_str in old_merged_document_data.get("meta_tags", {}).items()
-                        },
-                        "text": merged_inline_text
-                    }
-                }
-                transformed_document["merged_document_data"] = new_merged_document_data
-                data={
-                    "document": transformed_document,
-                }
+    def _transform_comparison_document(self, document: dict) -> dict:
+        """
+        Transforms a loaded comparison document of schema version 2 to the internal schema.
+        Args:
+            document (dict): The loaded comparison document.
+        Returns:
+            dict: The transformed document.
+        """
+        transformed_document = {
+            "document_type": "comparison",
+            "file_name": document.get("file_name", ""),
+            "source_paths": document.get("source_paths", []),
+            "source_file_names": document.get("source_file_names", []),
+            "file_path": document.get("file_path", ""),
+            "num_sentences": document.get("num_sentences", 0),
+            "current_sentence_index": document.get("current_sentence_index", 0),
+            "comparison_sentences": None,
+            "adopted_flags": document.get("adopted_flags", []),
+            "differing_to_global": document.get("differing_to_global", []),
+            "merged_document_data": {}
+        }
+        # merge all sentences of all groups in one flat pass and regroup afterwards
+        sentence_groups = document.get("comparison_sentences", [])
+        merge_plain_text_and_tags = self._merge_plain_text_and_tags
+        inline_texts = [
+            merge_plain_text_and_tags(sentence.get("plain_text", ""), sentence.get("tags", []))
+            for sentence in chain.from_iterable(sentence_groups)
+        ]
+        transformed_document["comparison_sentences"] = self._regroup(
+            inline_texts, [len(sentence_group) for sentence_group in sentence_groups])
+
+        old_merged_document_data = document.get("merged_document_data", {})
+        merged_inline_text = merge_plain_text_and_tags(
+            old_merged_document_data.get("plain_text", ""),
+            old_merged_document_data.get("tags", [])
+        )
+        new_merged_document_data = {
+            "document":{
+                "file_name": old_merged_document_data.get("file_name", ""),
+                "file_path": old_merged_document_data.get("file_path", ""),
+                "meta_tags": self._parse_meta_tags(old_merged_document_data.get("meta_tags", {})),
+                "text": merged_inline_text
+            }
+        }
+        transformed_document["merged_document_data"] = new_merged_document_data
+        return {
+            "document": transformed_document,
+        }
 
-            elif document.get("document_type") == "annotation":
-                inline_text = self._tag_processor.merge_plain_text_and_tags(
-                    document.get("plain_text", ""),
-                    document.get("tags", [])
-                )
-                transformed_document = {
+    def _transform_annotation_document(self, document: dict) -> dict:
+        """
+        Transforms a loaded annotation document of schema version 2 to the internal schema.
+        Args:
+            document (dict): The loaded annotation document.
+        Returns:
+            dict: The transformed document.
+        """
+        if not document.get("meta_tags") and not document.get("tags"):
+            # without any tags the plain text already is the inline text
+            return {
+                "document": {
                     "document_type": "annotation",
                     "file_path": document.get("file_path", ""),
                     "file_name": document.get("file_name", ""),
-                    "meta_tags": {
-                        tag_type: [tag.strip() for tag in tags_str.split(",")]
-                        for tag_type, tags_str in document.get("meta_tags", {}).items()
-                    },
-                    "text": inline_text,
-
-                }
-                data={
-                    "document": transformed_document,
-                }
-            elif document.get("document_type") == "extraction":
-                raise ValueError(
-                    "Extraction document type is not needed to be transformed.")
-            else:
-                raise ValueError(
-                    f"Unknown document type: {document.get('document_type')}")
-        else:#schema 1
-            data = {
-                "document": document
+                    "meta_tags": {},
+                    "text": document.get("plain_text", ""),
+                },
             }
-            if document.get("document_type") == "comparison":
-                data["document"]["merged_document_data"] = {"document": data["document"]["merged_document_data"]}
+        inline_text = self._merge_plain_text_and_tags(
+            document.get("plain_text", ""),
+            document.get("tags", [])
+        )
+        transformed_document = {
+            "document_type": "annotation",
+            "file_path": document.get("file_path", ""),
+            "file_name": document.get("file_name", ""),
+            "meta_tags": self._parse_meta_tags(document.get("meta_tags", {})),
+            "text": inline_text,
 
+        }
+        return {
+            "document": transformed_document,
+        }
 
+    def _transform_schema_1_document(self, document: dict) -> dict:
+        """
+        Wraps a loaded document of schema version 1, which already uses the internal layout.
+        Args:
+            document (dict): The loaded document.
+        Returns:
+            dict: The wrapped document.
+        """
+        data = {
+            "document": document
+        }
+        if document.get("document_type") == "comparison":
+            data["document"]["merged_document_data"] = {"document": data["document"]["merged_document_data"]}
         return data
-            
-  
\ No newline at end of file
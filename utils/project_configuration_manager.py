@@ -1,7 +1,21 @@
+import copy
 import os
-from typing import Dict, List
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from sys import intern
+from typing import Dict, List, Optional, Tuple
 from input_output.file_handler import FileHandler
 
+# Below this many files the thread pool setup costs more than the overlapped reads save
+_PARALLEL_READ_THRESHOLD = 4
+_MAX_READ_WORKERS = 16
+# Locations inside a project directory, hardcoded since the FileHandler would need project context
+_PROJECT_FILE_SUFFIX = os.path.join("config", "settings", "project.json")
+_TAGS_DIR_SUFFIX = os.path.join("config", "tags")
+# Attribute types whose values identify or reference tags
+_ID_ATTRIBUTE_TYPES = frozenset(("ID", "IDREF"))
+
 
 class ProjectConfigurationManager:
     """
@@ -19,6 +33,29 @@ class ProjectConfigurationManager:
             file_handler (FileHandler): Used to load configuration files via key-based paths.
         """
         self._file_handler = file_handler
+        # Parsed JSON files by file identity, together with the modification time and size they were read at
+        self._file_cache: Dict[object, Tuple[Tuple[int, int], Dict]] = {}
+        # Subdirectories of the project directory, with the directory's modification time they were listed at
+        self._project_directories: Optional[Tuple[int, List[str]]] = None
+        # Case-converted tag names, interned since they come from a small, recurring vocabulary
+        self._upper_names: Dict[str, str] = {}
+        self._lower_names: Dict[str, str] = {}
+
+    @cached_property
+    def _projects_path(self) -> str:
+        """
+        The directory containing all projects. It does not depend on the current project,
+        so it is resolved only once.
+        """
+        return self._file_handler.resolve_path("project_directory")
+
+    @cached_property
+    def _tag_pool_path(self) -> str:
+        """
+        The directory of the app's built-in tag pool. It does not depend on the current project,
+        so it is resolved only once.
+        """
+        return self._file_handler.resolve_path("app_tagpool")
 
     def load_configuration(self) -> Dict:
         """
@@ -35,27 +72,23 @@ class ProjectConfigurationManager:
 
         template_groups = self._load_template_groups()
 
-        id_prefixes = {}
-        id_names = {}
-        id_ref_attributes = {}
-        tag_types = []
-
-        for group in template_groups:
-            for template in group.get("templates", []):
-                tag_type = template.get("type")
-                tag_types.append(tag_type)
-                attributes = template.get("attributes", {})
-
-                id_prefixes[tag_type] = template.get("id_prefix", "")
-                id_names[tag_type] = id_prefixes[tag_type] + "id"
-                # id_names[tag_type] = next(
-                #     (attr for attr, details in attributes.items()
-                #      if details.get("type") == "ID"), ""
-                # )
-                id_ref_attributes[tag_type] = [
-                    attr for attr, details in attributes.items()
-                    if details.get("type") in {"ID", "IDREF"}
-                ]
+        # flatten the templates of all groups once, then derive each mapping in its own comprehension
+        templates = [
+            template for group in template_groups
+            for template in group.get("templates", [])
+        ]
+        tag_types = [template.get("type") for template in templates]
+        id_prefixes = {
+            template.get("type"): template.get("id_prefix", "") for template in templates
+        }
+        id_names = {tag_type: id_prefix + "id" for tag_type, id_prefix in id_prefixes.items()}
+        id_ref_attributes = {
+            template.get("type"): [
+                attr for attr, details in template.get("attributes", {}).items()
+                if details.get("type") in _ID_ATTRIBUTE_TYPES
+            ]
+            for template in templates
+        }
 
         layout["template_groups"] = template_groups
         layout["tag_types"] = tag_types
@@ -102,23 +135,32 @@ class ProjectConfigurationManager:
             FileNotFoundError: If `groups.json` or a tag template file is not found.
             JSONDecodeError: If a file is not in valid JSON format.
         """
-        project_data = self._file_handler.read_file("project_settings")
+        project_data = self._read_file_cached("project_settings")
         group_file_name = project_data.get(
             "current_group_file", "default_groups")
 
         groups: Dict[str, List[str]
-                     ] = self._file_handler.read_file("project_tag_groups_directory", group_file_name)
+                     ] = self._read_file_cached("project_tag_groups_directory", group_file_name)
         template_groups: List[Dict[str, List[Dict]]] = []
 
+        # resolve the tags directory once, with a trailing separator to append file names to
+        tags_dir = os.path.join(self._file_handler.resolve_path(
+            "project_config_directory"), "tags", "")
+        file_paths: List[str] = [
+            f"{tags_dir}{self._to_lower_name(group_member)}.json"
+            for group_members in groups.values()
+            for group_member in group_members
+        ]
+        # a template can belong to several groups, so every distinct file is read only once
+        unique_file_paths = list(dict.fromkeys(file_paths))
+        templates_by_path = dict(
+            zip(unique_file_paths, self._read_files_cached(unique_file_paths)))
+        # templates end up in the returned layout, so hand out copies of the cached data
+        loaded_templates = iter([copy.deepcopy(templates_by_path[file_path])
+                                 for file_path in file_paths])
+
         for group_name, group_members in groups.items():
-            templates: List[Dict] = []
-            for group_member in group_members:
-                file_path = os.path.join(self._file_handler.resolve_path(
-                    "project_config_directory"),
-                    f"tags/{group_member.lower()}.json"
-                )
-                templates.append(
-                    self._file_handler.read_file(file_path=file_path))
+            templates: List[Dict] = [next(loaded_templates) for _ in group_members]
             template_groups.append(
                 {"group_name": group_name, "templates": templates})
 
@@ -139,24 +181,55 @@ class ProjectConfigurationManager:
             FileNotFoundError: If a project.json file is missing in a subdirectory.
             JSONDecodeError: If a project.json is not a valid JSON file.
         """
-        projects_path = self._file_handler.resolve_path("project_directory")
-        results: List[Dict[str, str]] = []
-
-        for directory in os.listdir(projects_path):
-            subdir_path = os.path.join(projects_path, directory)
-            if os.path.isdir(subdir_path):
-                project_file = os.path.join(
-                    subdir_path, "config", "settings", "project.json")  # hardcoded since the filehandler would need project context
-                if os.path.isfile(project_file):
-                    data = self._file_handler.read_file(file_path=project_file)
-                    project_name = data.get("name")
-                    if project_name:
-                        results.append({
-                            "name": project_name,
-                            "path": project_file
-                        })
-
-        return results
+        return [
+            {"name": project["name"], "path": project["path"]}
+            for project in self._scan_projects()
+        ]
+
+    def _scan_projects(self) -> List[Dict[str, str]]:
+        """
+        Collects all valid projects of the project directory, shared by `get_projects` and `get_available_tags`.
+
+        The list of project directories is kept between calls and only listed again when the
+        modification time of the project directory changes, i.e. when projects are added, removed
+        or renamed. Each project.json is still stat-ed on every call, so edited project files are
+        picked up through the read cache.
+
+        Returns:
+            List[Dict[str, str]]: A list of dictionaries, each containing:
+                - 'name': Project name from project.json
+                - 'path': Path to the project's project.json file
+                - 'tags_dir': Path to the project's tags directory, which may not exist
+
+        Raises:
+            JSONDecodeError: If a project.json is not a valid JSON file.
+        """
+        projects_path = self._projects_path
+        modification_time = os.stat(projects_path).st_mtime_ns
+        if self._project_directories is None or self._project_directories[0] != modification_time:
+            with os.scandir(projects_path) as entries:
+                project_directories = [entry.path for entry in entries if entry.is_dir()]
+            self._project_directories = (modification_time, project_directories)
+
+        projects: List[Dict[str, str]] = []
+        for project_directory in self._project_directories[1]:
+            # Hardcoded path because FileHandler requires project context to resolve directories.
+            # We cannot assume that each directory name always matches a project name, so direct path construction is more robust here.
+            project_file = f"{project_directory}{os.sep}{_PROJECT_FILE_SUFFIX}"
+            # the project file's stat is reused to validate the read cache
+            project_stat = self._stat_path(project_file)
+            if project_stat is None or not stat.S_ISREG(project_stat.st_mode):
+                continue
+            project_data = self._read_file_cached(
+                project_file, file_stat=project_stat)
+            project_name = project_data.get("name")
+            if project_name:
+                projects.append({
+                    "name": project_name,
+                    "path": project_file,
+                    "tags_dir": f"{project_directory}{os.sep}{_TAGS_DIR_SUFFIX}"
+                })
+        return projects
 
     # todo move to another class
     def get_available_tags(self) -> List[Dict[str, str]]:
@@ -175,52 +248,141 @@ class ProjectConfigurationManager:
             FileNotFoundError: If a required file or directory is missing.
             JSONDecodeError: If project.json is invalid.
         """
-        projects_path = self._file_handler.resolve_path("project_directory")
         tag_directories: List[Dict[str, str]] = []
-        results: List[Dict[str, str]] = []
-        for directory in os.listdir(projects_path):
-            project = {}
-            subdir_path = os.path.join(projects_path, directory)
-            if os.path.isdir(subdir_path):
-                # Hardcoded path because FileHandler requires project context to resolve directories.
-                # We cannot assume that each directory name always matches a project name, so direct path construction is more robust here.
-                project_file = os.path.join(
-                    subdir_path, "config", "settings", "project.json")
-                project["tags_dir"] = os.path.join(
-                    subdir_path, "config", "tags")
-                if not os.path.isfile(project_file) or not os.path.isdir(project["tags_dir"]):
-                    continue
-
-                project_data = self._file_handler.read_file(
-                    file_path=project_file)
-                project["project_name"] = project_data.get("name")
-                if not project["project_name"]:
-                    continue
-                tag_directories.append(project)
+        for scanned_project in self._scan_projects():
+            tags_dir_stat = self._stat_path(scanned_project["tags_dir"])
+            if tags_dir_stat is None or not stat.S_ISDIR(tags_dir_stat.st_mode):
+                continue
+            tag_directories.append({
+                "project_name": scanned_project["name"],
+                "tags_dir": scanned_project["tags_dir"]
+            })
         # Include the app's built-in tag pool
         tag_pool = {}
         tag_pool["project_name"] = "tag_pool"
-        tag_pool["tags_dir"] = self._file_handler.resolve_path(
-            "app_tagpool")
+        tag_pool["tags_dir"] = self._tag_pool_path
         tag_directories.append(tag_pool)
 
         # Now scan each project's tags directory for tag files
+        tag_entries: List[Tuple[str, str, str]] = []
         for project in tag_directories:
-            for file_name in os.listdir(project["tags_dir"]):
-                if file_name.endswith(".json"):
-                    base_name = os.path.splitext(file_name)[0]
-                    tag_path = os.path.join(project["tags_dir"], file_name)
-                    tag_file = self._file_handler.read_file(
-                        file_path=tag_path)
-                    tag_name = tag_file.get("type", base_name)
-                    has_database = tag_file.get("has_database", False)
-                    id_prefix = tag_file.get("id_prefix", "")
-                    results.append({
-                        "name": tag_name.upper(),
-                        "file_name": base_name,
-                        "path": tag_path,
-                        "project": project["project_name"],
-                        "has_database": has_database,
-                        "id_prefix": id_prefix
-                    })
-        return results
+            with os.scandir(project["tags_dir"]) as entries:
+                for entry in entries:
+                    file_name = entry.name
+                    if file_name.endswith(".json") and entry.is_file():
+                        # the suffix is known, so slicing it off replaces os.path.splitext
+                        base_name = file_name[:-5]
+                        tag_entries.append(
+                            (project["project_name"], base_name, entry.path))
+
+        # Read all tag files at once, unchanged files come from the read cache
+        tag_files = self._read_files_cached([tag_entry[2] for tag_entry in tag_entries])
+        tags: List[Dict[str, str]] = []
+        for (project_name, base_name, tag_path), tag_file in zip(tag_entries, tag_files):
+            tags.append({
+                "name": self._to_upper_name(tag_file.get("type", base_name)),
+                "file_name": base_name,
+                "path": tag_path,
+                "project": project_name,
+                "has_database": tag_file.get("has_database", False),
+                "id_prefix": tag_file.get("id_prefix", "")
+            })
+        return tags
+
+    def _to_upper_name(self, name: str) -> str:
+        """
+        Returns the interned upper-case form of a tag name, converting each distinct name only once.
+
+        Args:
+            name (str): The tag name.
+
+        Returns:
+            str: The upper-case tag name.
+        """
+        upper_name = self._upper_names.get(name)
+        if upper_name is None:
+            upper_name = self._upper_names[name] = intern(name.upper())
+        return upper_name
+
+    def _to_lower_name(self, name: str) -> str:
+        """
+        Returns the interned lower-case form of a tag name, converting each distinct name only once.
+
+        Args:
+            name (str): The tag name.
+
+        Returns:
+            str: The lower-case tag name.
+        """
+        lower_name = self._lower_names.get(name)
+        if lower_name is None:
+            lower_name = self._lower_names[name] = intern(name.lower())
+        return lower_name
+
+    def _read_file_cached(self, key: str, extension: str = "", *, file_stat: Optional[os.stat_result] = None) -> Dict:
+        """
+        Reads a file via the FileHandler, reusing the parsed content as long as the file is unchanged.
+
+        The cache is keyed by the file's device and inode, so a file reached through symlinks or
+        several paths is parsed only once. Filesystems that report no inode fall back to the
+        resolved absolute path. Entries are validated against the file's modification time
+        and size, so edits on disk are picked up on the next read even when they share a timestamp.
+
+        Args:
+            key (str): Path to the file or key to be resolved.
+            extension (str, optional): Optional extension to append before reading.
+            file_stat (Optional[os.stat_result], optional): The file's stat result if the caller has
+                already stat-ed it. Defaults to None, in which case the file is stat-ed here.
+
+        Returns:
+            Dict: The content of the file. The dictionary is shared between calls and must not be modified.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = os.path.abspath(self._file_handler.resolve_path(key, extension))
+        if file_stat is None:
+            file_stat = os.stat(file_path)
+        cache_key = (file_stat.st_dev, file_stat.st_ino) if file_stat.st_ino else file_path
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._file_cache.get(cache_key)
+        if cached is not None and cached[0] == file_version:
+            return cached[1]
+        data = self._file_handler.read_file(file_path=file_path)
+        self._file_cache[cache_key] = (file_version, data)
+        return data
+
+    def _stat_path(self, path: str) -> Optional[os.stat_result]:
+        """
+        Stats a path, following symlinks like `os.path.isfile` and `os.path.isdir` do.
+
+        Args:
+            path (str): The path to stat.
+
+        Returns:
+            Optional[os.stat_result]: The stat result, or None if the path does not exist or cannot be accessed.
+        """
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+    def _read_files_cached(self, file_paths: List[str]) -> List[Dict]:
+        """
+        Reads several files via `_read_file_cached`, overlapping the disk reads in a thread pool
+        when there are enough files to make it worthwhile.
+
+        Args:
+            file_paths (List[str]): Paths of the files to read.
+
+        Returns:
+            List[Dict]: The content of each file, in the order of `file_paths`.
+                The dictionaries are shared with the cache and must not be modified.
+
+        Raises:
+            FileNotFoundError: If one of the files does not exist.
+        """
+        if len(file_paths) <= _PARALLEL_READ_THRESHOLD:
+            return list(map(self._read_file_cached, file_paths))
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(file_paths))) as executor:
+            return list(executor.map(self._read_file_cached, file_paths))
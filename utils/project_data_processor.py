@@ -1,14 +1,38 @@
+from typing import NamedTuple
 from controller.interfaces import IController
 from enums.project_data_error import ProjectDataError
 from exceptions.project_creation_aborted import ProjectCreationAborted
 from input_output.interfaces import IFileHandler
 
+# required project data fields and the error reported when a field is missing or empty
+_REQUIRED_PROJECT_DATA_FIELDS = (
+    ("project_name", ProjectDataError.EMPTY_PROJECT_NAME),
+    ("selected_tags", ProjectDataError.EMPTY_SELECTED_TAGS),
+    ("tag_groups", ProjectDataError.EMPTY_TAG_GROUPS),
+)
+
+
+class _TagEntry(NamedTuple):
+    """The fields of a selected tag that the payload steps need, derived once per tag."""
+    tag: dict
+    name: str
+    file_name: str
+    has_database: bool
+    original_name: str
+    source_project: str
+
 
 class ProjectDataProcessor:
     def __init__(self, controller: IController, file_handler: IFileHandler):
         self._controller: IController = controller
         self._file_handler: IFileHandler = file_handler
         self._project_data: dict[str, any] = None
+        # derived file names by tag name, since every payload step derives them again
+        self._file_names: dict[str, str] = {}
+        # per selected tag, derived once for all payload steps
+        self._tag_index: list[_TagEntry] = []
+        # names of the selected tags, shared by the payload steps
+        self._tag_names: list[str] = []
         # self._build_data: dict[str, any] = None
 
     def get_project_build_data(self, project_data: dict[str, any]) -> dict[str, any]:
@@ -45,7 +69,6 @@ class ProjectDataProcessor:
         self._fix_validation_errors()
         self._normalize()
         self._complete()
-        self._create_build_data()
         return self._create_build_data()
 
     # main steps
@@ -54,17 +77,13 @@ class ProjectDataProcessor:
         Performs initial validation checks on the provided project data.
         Populates self._errors with any validation issues found.
         """
-        self._errors = []
+        project_data_get = self._project_data.get
         # check if data has required fields
-        if not self._project_data.get("project_name", None):
-            self._errors.append(ProjectDataError.EMPTY_PROJECT_NAME)
-        if not self._project_data.get("selected_tags", []):
-            self._errors.append(ProjectDataError.EMPTY_SELECTED_TAGS)
-
-        if not self._project_data.get("tag_groups", {}):
-            self._errors.append(ProjectDataError.EMPTY_TAG_GROUPS)
-        # check for duplicate project name
-        if self._controller.does_project_exist(self._project_data.get("project_name", None)):
+        self._errors = [error for field, error in _REQUIRED_PROJECT_DATA_FIELDS
+                        if not project_data_get(field)]
+        # check for duplicate project name, an empty name cannot exist and is already reported
+        project_name = project_data_get("project_name", None)
+        if project_name and self._controller.does_project_exist(project_name):
             self._errors.append(ProjectDataError.DUPLICATE_PROJECT_NAME)
 
     def _fix_validation_errors(self) -> None:
@@ -73,7 +92,8 @@ class ProjectDataProcessor:
         This method will repeatedly prompt the controller to handle errors until
         there are no more errors left to address.
         """
-        for error in self._errors:
+        # dict.fromkeys drops repeated errors while keeping their order, each is handled once
+        for error in dict.fromkeys(self._errors):
             self._controller.handle_project_data_error(error)
 
     def _normalize(self) -> None:
@@ -95,6 +115,13 @@ class ProjectDataProcessor:
         Note:
             This step modifies self._project_data in place by adding necessary data.
         """
+        derive_file_name = self._derive_file_name
+        self._tag_index = [
+            _TagEntry(tag, tag["name"], derive_file_name(tag["name"]), tag.get("has_database", False),
+                      tag.get("original_name", tag["name"]), tag.get("project", ""))
+            for tag in self._project_data.get("selected_tags", [])
+        ]
+        self._tag_names = [tag_entry.name for tag_entry in self._tag_index]
         self._collect_additional_data()
         self._create_payloads()
 
@@ -115,28 +142,29 @@ class ProjectDataProcessor:
             tag.setdefault("original_name", tag.get("name", "unknown"))
             tag.setdefault("original_id_prefix",
                            tag.get("id_prefix", "unknown"))
+        # index the tags by name once, only renamed tags are reinserted afterwards
+        tags_by_name = {}
+        for tag in tags:
+            tags_by_name.setdefault(tag["name"], []).append(tag)
         are_tag_names_modified = False
         while True:
             # search the duplicates
-            tags_by_name = {}
-            for tag in tags:
-                tags_by_name.setdefault(tag["name"], []).append(tag)
             duplicates = {name: tag_list for name,
                           tag_list in tags_by_name.items() if len(tag_list) > 1}
-            non_duplicates = [tag_list[0]
-                              for _, tag_list in tags_by_name.items() if len(tag_list) == 1]
-            if duplicates:
-                renamed_duplicate_tags = self._controller.handle_project_data_error(ProjectDataError.TAG_NAME_DUPLICATES,
-                                                                                    duplicates)
-                if renamed_duplicate_tags is None:
-                    raise ProjectCreationAborted(
-                        "User aborted duplicate tag renaming.")
-                are_tag_names_modified = True
-                if renamed_duplicate_tags is None:  # if user cancelled dialog
-                    return
-                tags = non_duplicates + renamed_duplicate_tags
-                continue  # recheck for duplicates
-            break  # loop until no duplicates are found
+            if not duplicates:
+                break  # loop until no duplicates are found
+            renamed_duplicate_tags = self._controller.handle_project_data_error(ProjectDataError.TAG_NAME_DUPLICATES,
+                                                                                duplicates)
+            if renamed_duplicate_tags is None:
+                raise ProjectCreationAborted(
+                    "User aborted duplicate tag renaming.")
+            are_tag_names_modified = True
+            for name in duplicates:
+                del tags_by_name[name]
+            for tag in renamed_duplicate_tags:
+                tags_by_name.setdefault(tag["name"], []).append(tag)
+        if are_tag_names_modified:
+            tags = [tag_list[0] for tag_list in tags_by_name.values()]
         self._project_data["selected_tags"] = tags
         self._project_data["are_tag_names_modified"] = are_tag_names_modified
 
@@ -163,72 +191,133 @@ class ProjectDataProcessor:
         Note:
             This step modifies self._project_data in place by adding database info to relevant tags.
         """
-        self._add_database_info_to_tags()
+        self._collect_database_data()
 
-    def _add_database_info_to_tags(self) -> None:
+    def _collect_database_data(self) -> None:
         """
-        Adds database information to each tag that requires a database.
-        This method retrieves the necessary database configuration from the source project.
+        Collects the database info, database config payloads and database registry locks
+        of all tags that require a database in a single pass.
+        The tags are grouped by their source project, so each source project is entered
+        and its settings are read only once.
         Note:
-            This step modifies self._project_data in place by adding database info to relevant tags.
+            This step modifies self._project_data in place by adding database info to relevant tags,
+            the database config payloads and the database registry locks.
         Raises:
             ValueError: If required database information is missing for any tag.
         """
-        for tag in self._project_data.get("selected_tags", []):
-            # collect needed database
-            if not tag.get("has_database", False):
+        tags_by_source_project = {}
+        for tag_entry in self._tag_index:
+            if tag_entry.has_database:
+                tags_by_source_project.setdefault(
+                    tag_entry.source_project, []).append(tag_entry)
+        # keep the payloads in tag order, independent of the source project grouping
+        registry_locks = dict.fromkeys(
+            tag_entry.file_name for tag_entry in self._tag_index if tag_entry.has_database)
+        database_config_payloads = dict.fromkeys(
+            tag_entry.file_name for tag_entry in self._tag_index
+            if tag_entry.has_database and tag_entry.source_project != "tag_pool")
+        read_file = self._file_handler.read_file
+        resolve_path = self._file_handler.resolve_path
+        use_project = self._file_handler.use_project
+        derive_file_name = self._derive_file_name
+        add_database_info_to_tag = self._add_database_info_to_tag
+        for source_project, tag_entries in tags_by_source_project.items():
+            if source_project == "tag_pool":
+                for tag, tag_name, file_name, _, original_name, _ in tag_entries:
+                    database_config = read_file(
+                        "app_database_configs", derive_file_name(original_name))
+                    registry_locks[file_name] = add_database_info_to_tag(
+                        tag, tag_name, file_name, source_project, database_config)
                 continue
+            config_paths = {}
+            with use_project(source_project):
+                source_tag_settings = read_file(
+                    "project_settings").get("tags", {})
+                for tag, tag_name, file_name, _, original_name, _ in tag_entries:
+                    try:
+                        source_registry_lock_name = source_tag_settings[
+                            tag_name][original_name]["database"]["registry_lock"]
+                    except KeyError:
+                        source_registry_lock_name = derive_file_name(
+                            original_name)
+                    source_registry_lock = read_file("project_database_registry_locks_directory",
+                                                     source_registry_lock_name)
+                    registry_locks[file_name] = add_database_info_to_tag(
+                        tag, tag_name, file_name, source_project, source_registry_lock)
+                    try:
+                        source_database_config_file = source_tag_settings[
+                            original_name]["database"]["current_config_file"]
+                    except KeyError:
+                        source_database_config_file = derive_file_name(
+                            original_name)
+                    config_paths[file_name] = resolve_path(
+                        "project_database_config_directory", source_database_config_file)
+            for file_name, config_path in config_paths.items():
+                database_config_payloads[file_name] = read_file(config_path)
+        self._project_data["database_config_payloads"] = database_config_payloads
+        self._project_data["database_registry_locks"] = registry_locks
 
-            tag_name = tag.get("name", "")
-            default_file = self._derive_file_name(tag_name)
-            database_info = {
-                "current_config_file": default_file,
-                "config_files": [
-                    default_file
-                ],
-                "registry_lock": default_file
-            }
-            tag_source_project = tag.get("project", "")
-            original_name = tag.get("original_name", tag_name)
-            if tag_source_project == "tag_pool":
-                database_config = self._file_handler.read_file(
-                    "app_database_configs", self._derive_file_name(original_name))
-                source_registry = database_config.get(
-                    "source_registry", "")
-                source = database_config.get("source", "")
-            else:
-                with self._file_handler.use_project(tag_source_project):
-                    project_settings = self._file_handler.read_file(
-                        "project_settings")
-                    source_registry_lock_name = project_settings.get(
-                        "tags", {}).get(tag_name, {}).get(original_name, {}).get("database", {}).get("registry_lock", self._derive_file_name(original_name))
-                    source_registry_lock = self._file_handler.read_file("project_database_registry_locks_directory",
-                                                                        source_registry_lock_name)
-                    source_registry = source_registry_lock.get(
-                        "source_registry", "")
-                    source = source_registry_lock.get("source", "")
-            if not source_registry or not source:
-                raise ValueError(
-                    f"Missing source_registry or source for tag {tag_name} in project {tag_source_project}")
-
-            tag["database"] = database_info
-            tag["source_registry"] = source_registry
-            tag["source"] = source
+    def _add_database_info_to_tag(self, tag: dict, tag_name: str, file_name: str, source_project: str,
+                                  source_data: dict) -> dict:
+        """
+        Adds the database information to a tag that requires a database and creates its registry lock.
+
+        Args:
+            tag (dict): The tag to add the database information to.
+            tag_name (str): The unique name of the tag in the new project.
+            file_name (str): The derived file name of the tag.
+            source_project (str): The project the tag is taken from.
+            source_data (dict): The source database config or registry lock holding
+                "source_registry" and "source".
+
+        Returns:
+            dict: The database registry lock of the tag.
+
+        Raises:
+            ValueError: If source_registry or source is missing in the source data.
+        """
+        source_registry = source_data.get("source_registry")
+        source = source_data.get("source")
+        if not source_registry or not source:
+            raise ValueError(
+                f"Missing source_registry or source for tag {tag_name} in project {source_project}")
+
+        tag["database"] = {
+            "current_config_file": file_name,
+            "config_files": [
+                file_name
+            ],
+            "registry_lock": file_name
+        }
+        tag["source_registry"] = source_registry
+        tag["source"] = source
+        return {
+            "name": tag_name,
+            "database_registry": tag_name.lower().replace(" ", "_"),
+            "source_registry": source_registry,
+            "source": source,
+            "current_db": "",
+            "dbs": [],
+            "current_config_file": file_name,
+            "config_files": [
+                file_name
+            ],
+            "count": 0
+        }
 
     # Payloads
     def _create_payloads(self) -> None:
         """
         Creates various payloads required for the project based on the provided project data.
-        This method generates payloads for color schemes, tag definitions, database configurations,
-        project settings, database registry locks, auxiliary databases, and search normalization rules.
+        This method generates payloads for color schemes, tag definitions, project settings,
+        auxiliary databases, and search normalization rules. The database configurations and
+        registry locks are created together with the database info of the tags.
         Note:
             This step modifies self._project_data in place by adding the generated payloads.
         """
         self._create_default_color_scheme_payload()
         self._create_tag_definition_payloads()
-        self._create_database_config_payloads()
         self._create_project_settings_payload()
-        self._create_database_registry_locks_payload()
         self._create_auxdb_payload()
         self._create_search_normalization_payload()
 
@@ -239,8 +328,7 @@ class ProjectDataProcessor:
         Note:
             This step modifies self._project_data in place by adding the color scheme data.
         """
-        tag_keys = [tag["name"]
-                    for tag in self._project_data.get("selected_tags", [])]
+        tag_keys = self._tag_names
         colorset_name = "magma"
         complementary_search_color = True
         color_scheme_data = self._controller.perform_create_color_scheme(
@@ -258,43 +346,25 @@ class ProjectDataProcessor:
         and adds it to the project data.
         """
         tag_payloads = {}
-        for tag in self._project_data.get("selected_tags", []):
+        # tags taken from the same source file share its parsed definition, it is only read
+        source_definitions = {}
+        get_source_definition = source_definitions.get
+        read_file = self._file_handler.read_file
+        for tag, tag_name, file_name, _, _, _ in self._tag_index:
             source_path = tag.get("path", "")
-            source_definition = self._file_handler.read_file(source_path)
+            source_definition = get_source_definition(source_path)
+            if source_definition is None:
+                source_definition = source_definitions[source_path] = read_file(
+                    source_path)
             tag_definition = {
-                "type": tag.get("name", "UNKNOWN"),
+                "type": tag_name,
                 "has_database": source_definition.get("has_database", False),
                 "id_prefix": tag.get("id_prefix", ""),
                 "attributes": source_definition.get("attributes", [])
             }
-            tag_payloads[self._derive_file_name(
-                tag.get('name', ''))] = tag_definition
+            tag_payloads[file_name] = tag_definition
         self._project_data["tag_payloads"] = tag_payloads
 
-    def _create_database_config_payloads(self) -> None:
-        database_config_payloads = {}
-        for tag in self._project_data.get("selected_tags", []):
-            if not tag.get("has_database", False):
-                continue
-
-            source_tag_name = tag.get("original_name", tag.get("name", ""))
-            source_project = tag.get("project", "")
-            if source_project == "tag_pool":
-                config_path = self._file_handler.resolve_path(
-                    "app_database_configs", self._derive_file_name(source_tag_name))
-            else:
-                with self._file_handler.use_project(source_project):
-                    project_settings = self._file_handler.read_file(
-                        "project_settings")
-                    source_database_config_file = project_settings.get(
-                        "tags", {}).get(source_tag_name, {}).get("database", {}).get("current_config_file", self._derive_file_name(source_tag_name))
-                    config_path = self._file_handler.resolve_path(
-                        "project_database_config_directory", source_database_config_file)
-                database_config = self._file_handler.read_file(config_path)
-                database_config_payloads[self._derive_file_name(
-                    tag.get('name', ''))] = database_config
-        self._project_data["database_config_payloads"] = database_config_payloads
-
     def _create_project_settings_payload(self) -> None:
         """
         Creates the project settings based on the provided project data.
@@ -303,61 +373,29 @@ class ProjectDataProcessor:
         """
         default_settings = self._file_handler.read_file(
             "project_settings_defaults")
-        settings = {}
-        settings["name"] = self._project_data.get("project_name", "")
-        # tags and groups
-        settings["tags"] = {tag["name"]: {"file_name": self._derive_file_name(tag["name"]), "database": tag.get(
-            "database", {})} for tag in self._project_data.get("selected_tags", [])}
-        settings["current_group_file"] = self._project_data.get(
-            "tag_group_file_name", "")
-        settings["group_files"] = [
-            self._project_data.get("tag_group_file_name", "groups01.json")]
-
-        # other settings with defaults
-        settings["search_normalization"] = default_settings.get(
-            "default_search_normalization", "search_normalization_rules.json")
-        settings["color_scheme"] = self._project_data.get("color_scheme_data", {}).get(
-            "file_name", "default_color_scheme.json")
-        settings["are_all_search_results_highlighted"] = default_settings.get(
-            "default_are_all_search_results_highlighted", True)
-        settings["current_language"] = default_settings.get(
-            "default_language", "english")
-        settings["abbreviations"] = default_settings.get(
-            "default_abbreviations", "abbreviations.json")
-        settings["suggestions"] = default_settings.get(
-            "default_suggestions", "suggestions.json")
-        settings["wrong_suggestions"] = default_settings.get(
-            "default_wrong_suggestions", "wrong_suggestions.json")
+        get_default = default_settings.get
+        project_data_get = self._project_data.get
+        settings = {
+            "name": project_data_get("project_name", ""),
+            # tags and groups
+            "tags": {tag_name: {"file_name": file_name, "database": tag.get(
+                "database", {})} for tag, tag_name, file_name, _, _, _ in self._tag_index},
+            "current_group_file": project_data_get("tag_group_file_name", ""),
+            "group_files": [project_data_get("tag_group_file_name", "groups01.json")],
+            # other settings with defaults
+            "search_normalization": get_default(
+                "default_search_normalization", "search_normalization_rules.json"),
+            "color_scheme": project_data_get("color_scheme_data", {}).get(
+                "file_name", "default_color_scheme.json"),
+            "are_all_search_results_highlighted": get_default(
+                "default_are_all_search_results_highlighted", True),
+            "current_language": get_default("default_language", "english"),
+            "abbreviations": get_default("default_abbreviations", "abbreviations.json"),
+            "suggestions": get_default("default_suggestions", "suggestions.json"),
+            "wrong_suggestions": get_default("default_wrong_suggestions", "wrong_suggestions.json"),
+        }
         self._project_data["settings"] = settings
 
-    def _create_database_registry_locks_payload(self) -> None:
-        """
-        Creates database registry lock information for tags that require a database.
-        This method constructs a registry lock dictionary for each tag that has a database
-        and adds it to the tag data.
-        """
-        registry_locks = {}
-        for tag in self._project_data.get("selected_tags", []):
-            if not tag.get("has_database", False):
-                continue
-            tag_name = tag.get("name", "")
-            name_lower = tag_name.lower().replace(" ", "_")
-            registry_lock = {
-                "name": tag_name,
-                "database_registry": name_lower,
-                "source_registry": tag["source_registry"],
-                "source": tag["source"],
-                "current_db": "",
-                "dbs": [],
-                "current_config_file": self._derive_file_name(tag_name),
-                "config_files": [
-                    self._derive_file_name(tag_name)
-                ],
-                "count": 0
-            }
-            registry_locks[self._derive_file_name(tag_name)] = registry_lock
-        self._project_data["database_registry_locks"] = registry_locks
-
     def _create_auxdb_payload(self) -> None:
         """
         Creates auxiliary database data for the project.
@@ -373,13 +411,13 @@ class ProjectDataProcessor:
                 "abbreviations": {...}
             }
         """
-        project = self._project_data.get("project_name", "unknown_project")
-        with self._file_handler.use_project(project):
-            abbreviations = self._file_handler.read_file(
-                "abbreviations_defaults")
+        # the abbreviation defaults are an app path, they do not depend on the project context
+        abbreviations = self._file_handler.read_file("abbreviations_defaults")
         auxdb_data = {
-            "suggestions": {tag["name"]: {} for tag in self._project_data.get("selected_tags", [])},
-            "wrong_suggestions": {tag["name"]: [] for tag in self._project_data.get("selected_tags", [])},
+            # the auxdb payloads are only serialized into the new project files, never mutated,
+            # so all tags share one empty value; the tuple is written as an empty JSON list
+            "suggestions": dict.fromkeys(self._tag_names, {}),
+            "wrong_suggestions": dict.fromkeys(self._tag_names, ()),
             "abbreviations": abbreviations
         }
         self._project_data["auxdb_data"] = auxdb_data
@@ -418,110 +456,67 @@ class ProjectDataProcessor:
                 "search_normalization": {"path": "...", "payload": {...}}
             }
         """
-        build_data = {}
-        # color scheme
-        with self._file_handler.use_project(self._project_data.get("project_name", "unknown_project")):
-            color_scheme_data = self._project_data.get("color_scheme_data", {})
-            color_scheme_filename = color_scheme_data.get(
-                "file_name", "default_color_scheme.json")
-            color_scheme_path = self._file_handler.resolve_path(
-                "project_color_scheme_directory", color_scheme_filename)
-            build_data["color_scheme"] = {
-                "path": color_scheme_path,
-                "payload": color_scheme_data.get("color_scheme", {})
-            }
-
-        # tags
-            tag_build_data = []
-            for filename, tag_payload in self._project_data.get("tag_payloads", {}).items():
-                tag_path = self._file_handler.resolve_path(
-                    "project_tags_directory", filename)
-                tag_build_data.append({
-                    "path": tag_path,
-                    "payload": tag_payload
-                })
-            build_data["tags"] = tag_build_data
-
-        # tag groups
-            tag_groups_payload = self._project_data.get("tag_groups", {})
-            tag_group_file_name = self._project_data.get(
-                "tag_group_file_name", "groups01.json")
-            tag_groups_path = self._file_handler.resolve_path(
-                "project_tag_groups_directory", tag_group_file_name)
-            tag_groups_build_data = {
-                "path": tag_groups_path,
-                "payload": tag_groups_payload
-            }
-            build_data["tag_groups"] = tag_groups_build_data
-        # db config
-            db_config_build_data = []
-            for filename, db_config in self._project_data.get("database_config_payloads", {}).items():
-                db_config_path = self._file_handler.resolve_path(
-                    "project_database_config_directory", filename)
-                db_config_build_data.append({
-                    "path": db_config_path,
-                    "payload": db_config
-                })
-            build_data["database_configs"] = db_config_build_data
-        # project settings
-            project_settings_payload = self._project_data.get("settings", {})
-            project_settings_path = self._file_handler.resolve_path(
-                "project_settings")
-            project_settings_build_data = {
-                "path": project_settings_path,
-                "payload": project_settings_payload
-            }
-            build_data["project_settings"] = project_settings_build_data
-        # db registry locks
-            db_registry_locks_build_data = []
-            for filename, registry_lock in self._project_data.get("database_registry_locks", {}).items():
-                registry_lock_path = self._file_handler.resolve_path(
-                    "project_database_registry_locks_directory", filename)
-                db_registry_locks_build_data.append({
-                    "path": registry_lock_path,
-                    "payload": registry_lock
-                })
-            build_data["database_registry_locks"] = db_registry_locks_build_data
-        # abbreviations, suggestions, wrong suggestions
-            # paths
-            abbreviations_path = self._file_handler.resolve_path(
-                "project_abbreviations")
-            suggestions_path = self._file_handler.resolve_path(
-                "project_suggestions")
-            wrong_suggestions_path = self._file_handler.resolve_path(
-                "project_wrong_suggestions")
-            # unpack payloads
-            auxdb_payload = self._project_data.get("auxdb_data", {})
-            abbreviations_payload = auxdb_payload.get("abbreviations", {})
-            suggestions_payload = auxdb_payload.get("suggestions", {})
-            wrong_suggestions_payload = auxdb_payload.get(
-                "wrong_suggestions", {})
-            # build data
-            build_data["abbreviations"] = {
-                "path": abbreviations_path,
-                "payload": abbreviations_payload
-            }
-
-            build_data["suggestions"] = {
-                "path": suggestions_path,
-                "payload": suggestions_payload
-            }
-
-            build_data["wrong_suggestions"] = {
-                "path": wrong_suggestions_path,
-                "payload": wrong_suggestions_payload
+        project_data_get = self._project_data.get
+        create_build_entry = self._create_build_entry
+        create_build_entries = self._create_build_entries
+        color_scheme_data = project_data_get("color_scheme_data", {})
+        auxdb_payload = project_data_get("auxdb_data", {})
+        with self._file_handler.use_project(project_data_get("project_name", "unknown_project")):
+            build_data = {
+                "color_scheme": create_build_entry(
+                    "project_color_scheme_directory", color_scheme_data.get("color_scheme", {}),
+                    color_scheme_data.get("file_name", "default_color_scheme.json")),
+                "tags": create_build_entries(
+                    "project_tags_directory", project_data_get("tag_payloads", {})),
+                "tag_groups": create_build_entry(
+                    "project_tag_groups_directory", project_data_get("tag_groups", {}),
+                    project_data_get("tag_group_file_name", "groups01.json")),
+                "database_configs": create_build_entries(
+                    "project_database_config_directory", project_data_get("database_config_payloads", {})),
+                "project_settings": create_build_entry(
+                    "project_settings", project_data_get("settings", {})),
+                "database_registry_locks": create_build_entries(
+                    "project_database_registry_locks_directory", project_data_get("database_registry_locks", {})),
+                "abbreviations": create_build_entry(
+                    "project_abbreviations", auxdb_payload.get("abbreviations", {})),
+                "suggestions": create_build_entry(
+                    "project_suggestions", auxdb_payload.get("suggestions", {})),
+                "wrong_suggestions": create_build_entry(
+                    "project_wrong_suggestions", auxdb_payload.get("wrong_suggestions", {})),
+                "search_normalization_rules": create_build_entry(
+                    "project_search_normalization_rules", project_data_get("search_normalization_rules", {})),
             }
+        return build_data
 
-            # search normalization rules
-            search_normalization_rules_path = self._file_handler.resolve_path(
-                "project_search_normalization_rules")
-
-            build_data["search_normalization_rules"] = {
-                "path": search_normalization_rules_path,
-                "payload": self._project_data.get("search_normalization_rules", {})
-            }
+    def _create_build_entry(self, path_key: str, payload: any, file_name: str = "") -> dict[str, any]:
+        """
+        Creates a single build data entry of a file path and the payload written to it.
+        Note:
+            The path is resolved in the current project context.
+        Args:
+            path_key (str): The path key of the file or of its directory.
+            payload (any): The payload to write to the file.
+            file_name (str, optional): The file name within the directory of path_key.
+        Returns:
+            dict[str, any]: The build data entry with the keys "path" and "payload".
+        """
+        return {
+            "path": self._file_handler.resolve_path(path_key, file_name),
+            "payload": payload
+        }
 
-        return build_data
+    def _create_build_entries(self, directory_key: str, payloads: dict[str, any]) -> list[dict[str, any]]:
+        """
+        Creates the build data entries for several files in the same directory.
+        Args:
+            directory_key (str): The path key of the directory.
+            payloads (dict[str, any]): The payloads by file name.
+        Returns:
+            list[dict[str, any]]: The build data entries in the order of the payloads.
+        """
+        resolve_path = self._file_handler.resolve_path
+        return [{"path": resolve_path(directory_key, file_name), "payload": payload}
+                for file_name, payload in payloads.items()]
 
     def _derive_file_name(self, tag_name: str) -> str:
         """
@@ -535,7 +530,11 @@ class ProjectDataProcessor:
             >>> derive_file_name("Example Tag")
             "example_tag.json"
         """
+        filename = self._file_names.get(tag_name)
+        if filename is not None:
+            return filename
         filename = tag_name.lower().replace(" ", "_")
         if not filename.endswith(".json"):
             filename += ".json"
+        self._file_names[tag_name] = filename
         return filename
@@ -1,4 +1,6 @@
 import re
+from bisect import bisect_left
+from functools import lru_cache
 from typing import Dict, List
 from data_classes.search_result import SearchResult
 from enums.search_types import SearchType
@@ -6,6 +8,13 @@ from input_output.file_handler import FileHandler
 from model.interfaces import IDocumentModel
 from model.search_model import SearchModel
 
+# keeps XML elements together as one token, otherwise splits at whitespace
+_TOKEN_RE = re.compile(r'<[^>]+>.*?</[^>]+>|\S+')
+_XML_WRAP_RE = re.compile(r'^<[^>]+>.*</[^>]+>$')
+_XML_OPEN_RE = re.compile(r'^<[^>]+>')
+_XML_CLOSE_RE = re.compile(r'</[^>]+>$')
+_WHITESPACE_RE = re.compile(r'\s*')
+
 
 class SearchManager:
     def __init__(self, file_handler: FileHandler = None) -> None:
@@ -15,6 +24,8 @@ class SearchManager:
         """
         self._file_handler = file_handler
         self._common_suffixes: List[str] = []
+        # the suffixes as tuple, to reject words without any common suffix in one endswith call
+        self._common_suffixes_tuple: tuple = ()
         # Characters to strip from words during search
         self._chars_to_strip: str = ""
 
@@ -34,18 +45,21 @@ class SearchManager:
         text = document_model.get_text()
 
         # Improved tokenization: keeps XML elements together
-        tokens = re.findall(r'<[^>]+>.*?</[^>]+>|[^\s]+', text)
+        tokens = _TOKEN_RE.findall(text)
 
         index = 0
         char_pos = 0
+        # sorted keys per children dict, for the prefix lookahead
+        sorted_children_keys = {}
+        chars_to_strip = self._chars_to_strip
 
         while index < len(tokens):
             raw_token = tokens[index]
 
             # Remove XML tags if present and split into individual words
-            if re.match(r'^<[^>]+>.*</[^>]+>$', raw_token):
-                stripped_content = re.sub(r'^<[^>]+>', '', raw_token)
-                stripped_content = re.sub(r'</[^>]+>$', '', stripped_content)
+            if _XML_WRAP_RE.match(raw_token):
+                stripped_content = _XML_OPEN_RE.sub('', raw_token)
+                stripped_content = _XML_CLOSE_RE.sub('', stripped_content)
                 # Insert the stripped words back into tokens, replacing the original
                 stripped_words = stripped_content.split()
                 tokens[index:index+1] = stripped_words
@@ -53,13 +67,13 @@ class SearchManager:
             else:
                 stripped_token = raw_token
 
-            match_token = stripped_token.rstrip(self._chars_to_strip)
+            match_token = stripped_token.rstrip(chars_to_strip)
             current_dict = None
             base_word = match_token
 
             if match_token in db_dict:
                 current_dict = db_dict[match_token]
-            else:
+            elif match_token.endswith(self._common_suffixes_tuple):
                 for suffix in self._common_suffixes:
                     if match_token.endswith(suffix):
                         stripped = match_token[:-len(suffix)]
@@ -69,9 +83,8 @@ class SearchManager:
                             break
             if not current_dict:
                 next_token_pos = text.find(raw_token, char_pos)
-                char_pos = next_token_pos + len(raw_token)
-                while char_pos < len(text) and text[char_pos].isspace():
-                    char_pos += 1
+                char_pos = _WHITESPACE_RE.match(
+                    text, next_token_pos + len(raw_token)).end()
                 index += 1
                 continue
 
@@ -83,48 +96,47 @@ class SearchManager:
 
             # Check if the stripped token matches the expected length
             if len(match_token) == len(stripped_token):
-
+                # the tokens from index to j joined by spaces, extended by one token per step
+                joined_tokens = stripped_token
                 for j in range(index + 1, len(tokens)):
-                    end_traversal = False
                     next_raw = tokens[j]
-                    next_clean = next_raw.rstrip(self._chars_to_strip)
-                    candidate_tokens = [token for token in tokens[index:j+1]]
-                    candidate = " ".join(candidate_tokens)
-                    stripped_candidate = candidate.rstrip(self._chars_to_strip)
-                    if len(candidate) != len(stripped_candidate):
-                        # If there was stripping the traversal ends
-                        end_traversal = True
-                    candidate = stripped_candidate
-
+                    next_clean = next_raw.rstrip(chars_to_strip)
+                    # the candidate ends with the next token, so it is stripped
+                    # exactly when the next token is; then the traversal ends
+                    end_traversal = len(next_clean) != len(next_raw)
+                    joined_tokens += " " + next_raw
+                    candidate = joined_tokens.rstrip(chars_to_strip)
+
+                    children = match_data.get("children", {})
                     # candidate stripped of trailing special characters
                     # is a direct match in children
-                    if candidate in match_data.get(
-                            "children", {}):
+                    if candidate in children:
                         match_tokens.append(next_clean)
                         last_valid_tokens = match_tokens.copy()
-                        match_data = match_data["children"][candidate]
+                        match_data = children[candidate]
                         last_valid_data = match_data
                         end_index = j + 1
                         continue
 
                     suffix_free_candidate = candidate
-                    for suffix in self._common_suffixes:
-                        if candidate.endswith(suffix):
-                            suffix_free_candidate = candidate[:-len(suffix)]
+                    if candidate.endswith(self._common_suffixes_tuple):
+                        for suffix in self._common_suffixes:
+                            if candidate.endswith(suffix):
+                                suffix_free_candidate = candidate[:-len(suffix)]
 
                     # If the candidate stripped of common suffixes is a direct match in children
                     # we can continue traversing
-                    if suffix_free_candidate in match_data.get("children", {}):
+                    if suffix_free_candidate in children:
                         match_tokens.append(next_clean)
                         last_valid_tokens = match_tokens.copy()
-                        match_data = match_data["children"][suffix_free_candidate]
+                        match_data = children[suffix_free_candidate]
                         last_valid_data = match_data
                         end_index = j + 1
                         continue
 
                     tmp_lookahead = " ".join(
                         match_tokens + [next_clean])
-                    if any(key.startswith(tmp_lookahead) for key in match_data.get("children", {}).keys()):
+                    if self._has_key_with_prefix(children, tmp_lookahead, sorted_children_keys):
                         # If the next token is a valid continuation
                         match_tokens.append(next_clean)
                         end_index = j + 1
@@ -137,7 +149,7 @@ class SearchManager:
                         break
 
             matched_str_raw = " ".join(last_valid_tokens)
-            matched_str_clean = matched_str_raw.rstrip(self._chars_to_strip)
+            matched_str_clean = matched_str_raw.rstrip(chars_to_strip)
 
             start_char = text.find(matched_str_clean, char_pos)
 
@@ -157,12 +169,36 @@ class SearchManager:
             search_model.add_result(result)
 
             index = end_index
-            char_pos = end_char
-            while char_pos < len(text) and text[char_pos].isspace():
-                char_pos += 1
+            char_pos = _WHITESPACE_RE.match(text, end_char).end()
 
         return search_model
 
+    def _has_key_with_prefix(self, children: Dict, prefix: str, sorted_children_keys: Dict) -> bool:
+        """
+        Checks whether any of the children keys of a database node starts with the given prefix.
+
+        The keys of each children dict are sorted once per search, so the check is a binary search
+        for the first key not smaller than the prefix instead of a scan over all keys.
+
+        Args:
+            children (Dict): The children of a database node by phrase.
+            prefix (str): The prefix to look for.
+            sorted_children_keys (Dict): The children dicts of the current search and their sorted keys,
+                by id of the children dict.
+
+        Returns:
+            bool: True if a children key starts with the prefix, False otherwise.
+        """
+        # the cache holds a reference to each children dict, so its id cannot be reused during the search
+        cached = sorted_children_keys.get(id(children))
+        if cached is not None and cached[0] is children:
+            keys = cached[1]
+        else:
+            keys = sorted(children)
+            sorted_children_keys[id(children)] = (children, keys)
+        position = bisect_left(keys, prefix)
+        return position < len(keys) and keys[position].startswith(prefix)
+
     def calculate_manual_search_model(self, options: Dict, document_model: IDocumentModel, caller_id: str) -> SearchModel:
         """
         Calculates a SearchModel based on manual search parameters.
@@ -190,16 +226,10 @@ class SearchManager:
         if not term:
             return search_model
 
-        flags = 0 if options.get("case_sensitive") else re.IGNORECASE
-        if options.get("regex"):
-            pattern = term
-        else:
-            pattern = re.escape(term)
-
-        if options.get("whole_word"):
-            pattern = r'\b' + pattern + r'\b'
+        compiled_pattern = self._compile_search_pattern(
+            term, bool(options.get("case_sensitive")), bool(options.get("whole_word")), bool(options.get("regex")))
 
-        for match in re.finditer(pattern, text, flags):
+        for match in compiled_pattern.finditer(text):
             result = SearchResult(
                 term=match.group(),
                 start=match.start(),
@@ -210,6 +240,34 @@ class SearchManager:
         search_model.validate()
         return search_model
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _compile_search_pattern(term: str, case_sensitive: bool, whole_word: bool, regex: bool) -> re.Pattern:
+        """
+        Compiles the pattern of a manual search, cached per search term and options.
+
+        Args:
+            term (str): The term to search for.
+            case_sensitive (bool): Whether the search should be case-sensitive.
+            whole_word (bool): Whether to match only whole words.
+            regex (bool): Whether to interpret the search term as a regular expression.
+
+        Returns:
+            re.Pattern: The compiled search pattern.
+
+        Raises:
+            re.error: If the term is interpreted as a regular expression and is invalid.
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        if regex:
+            pattern = term
+        else:
+            pattern = re.escape(term)
+
+        if whole_word:
+            pattern = r'\b' + pattern + r'\b'
+        return re.compile(pattern, flags)
+
     def set_search_normalization(self, search_normalization: Dict) -> None:
         """
         Sets the search normalization parameters.
@@ -218,4 +276,5 @@ class SearchManager:
             search_normalization (Dict): Dictionary containing normalization settings.
         """
         self._common_suffixes = search_normalization.get("common_suffixes", [])
+        self._common_suffixes_tuple = tuple(self._common_suffixes)
         self._chars_to_strip = search_normalization.get("chars_to_strip", "")
@@ -246,13 +246,14 @@ class TagManager:
             tag.set_position(tag.get_position()+offset)
             if not (references := tag.get_references()):
                 continue
-            attributes = tag.get_attributes()
-            for attribute_name, old_ref_id in attributes.items():
+            updated_attributes = []
+            for attribute_name, old_ref_id in tag.get_attributes().items():
                 if attribute_name in references:
                     new_ref_id = references[attribute_name].get_id()
-                    attributes[attribute_name] = new_ref_id
+                    updated_attributes.append((attribute_name, new_ref_id))
                     offset += len(new_ref_id)-len(old_ref_id)
-                    # Notify processor about change
+            tag.set_attributes(updated_attributes)
+            # Notify processor about change
             text = self._tag_processor.update_tag(text, tag)
 
         target_model.set_tags(tags)
@@ -1,4 +1,5 @@
 import re
+from sys import intern
 from typing import List, Dict
 
 from controller.interfaces import IController
@@ -175,7 +176,9 @@ class TagProcessor(ITagProcessor):
 
         tags = []
         for match in tag_pattern.finditer(text):
-            tag_type = match.group("tag_type")
+            # Tag types and attribute names repeat across all tags, interning them lets
+            # every tag share one string object and speeds up comparisons and dict lookups
+            tag_type = intern(match.group("tag_type"))
             attributes_raw = match.group("attributes")
             content = match.group("content")
             start_position = match.start()
@@ -186,7 +189,8 @@ class TagProcessor(ITagProcessor):
                 continue
 
             # Parse attributes into a dictionary
-            attributes = dict(attribute_pattern.findall(attributes_raw))
+            attributes = {intern(key): value for key,
+                          value in attribute_pattern.findall(attributes_raw)}
             attributes["id"] = attributes.pop(id_name)
 
             # Extract reference keys from controller